@@ -1,11 +1,172 @@
+import dataclasses
+import json
+import os
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-import matplotlib.pyplot as plt
-import time
+from financial_health import charts, debt, lite_charts, score_profile, simulate_retirement
+from financial_health.forecast import (INCOME_REPLACEMENT_TARGET, RETIREMENT_SHARE, WITHDRAWAL_RATE, goal_forecast, goal_projection,
+                                       project_retirement, sensitivity_sweep)
+from financial_health.planner import plan_goals
+from financial_health.profile import Profile
+from financial_health.projection import PROJECTION_YEARS, project_net_worth
+from financial_health.profiling import RerunProfiler
+from financial_health.recommendations import EXPENSE_LABELS, budget_recommendations, health_recommendations
+from financial_health.rules import DEFAULT_RULE_SET, load_rules
+
+# Opt-in rerun profiling: set FINANCIAL_HEALTH_PROFILE=1 (or "cprofile" to
+# also capture a cProfile) to time each step and show the debug panel.
+# Server-side only, so visitors cannot turn it on from the URL.
+# FINANCIAL_HEALTH_PROFILE_LOG appends every rerun's timings to a JSON lines file
+PROFILE_MODE = os.environ.get("FINANCIAL_HEALTH_PROFILE", "")
+profiler = RerunProfiler(enabled=PROFILE_MODE not in ("", "0"), cprofile=PROFILE_MODE == "cprofile")
+plotly_chart = profiler.wrap("st.plotly_chart", st.plotly_chart)
+vega_lite_chart = profiler.wrap("st.vega_lite_chart", st.vega_lite_chart)
+image = profiler.wrap("st.image", st.image)
+
+# Backend for the cash-flow, 50/30/20 and goal forecast charts: "plotly"
+# (default), "vega" (native Vega-Lite, no Plotly.js download) or "svg" (a
+# static image). Set FINANCIAL_HEALTH_CHART_BACKEND or open the app with
+# ?charts=vega to choose; other charts always use Plotly
+CHART_BACKENDS = ["plotly", "vega", "svg"]
+CHART_BACKEND = st.query_params.get("charts") or os.environ.get("FINANCIAL_HEALTH_CHART_BACKEND", "plotly")
+if CHART_BACKEND not in CHART_BACKENDS:
+    CHART_BACKEND = "plotly"
+
+# Bounded caches shared across sessions: derived metrics and figures are only
+# rebuilt when the inputs they depend on change
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_SECONDS = 3600
+# Each sweep result is a 1.4 MB float32 cube, so only a handful are kept
+SWEEP_CACHE_MAX_ENTRIES = 16
+
+
+def cached(func=None, max_entries=CACHE_MAX_ENTRIES):
+    # Timed under the function's name when profiling is enabled
+    if func is None:
+        return lambda func: cached(func, max_entries)
+    return profiler.wrap(func.__name__, st.cache_data(max_entries=max_entries, ttl=CACHE_TTL_SECONDS, show_spinner=False)(func))
+
+
+def cached_figure(func):
+    # Plotly figures are shared rather than copied: cache_data would pickle them,
+    # and unpickling a figure costs more than building it. Nothing modifies a
+    # figure after it is built, so one object can serve every session
+    return profiler.wrap(func.__name__, st.cache_resource(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)(func))
+
+
+# Region- or client-specific thresholds and wording: FINANCIAL_HEALTH_RULES
+# names a JSON file of overrides to financial_health.rules.DEFAULT_RULES
+RULES_PATH = os.environ.get("FINANCIAL_HEALTH_RULES")
+
+
+@st.cache_resource
+def rule_set(path):
+    # Compiled once per rules file and shared by every session
+    return load_rules(path) if path else DEFAULT_RULE_SET
+
+
+@cached
+def cached_score_profile(profile, rules_path):
+    return score_profile(profile, rule_set(rules_path))
+
+
+@cached
+def retirement_simulation(retirement_savings, annual_contribution, years_to_retirement, mean_return, volatility,
+                          n_paths, target_balance, seed):
+    # Only the bands and the success rate are shown; the per-path final balances
+    # (800 KB at 100k paths) are dropped so each cache entry stays a few KB
+    result = simulate_retirement(retirement_savings, annual_contribution, years_to_retirement, mean_return, volatility,
+                                 n_paths=n_paths, target_balance=target_balance, seed=seed)
+    return dataclasses.replace(result, final_balances=None)
+
+
+cash_flow_figure = cached_figure(charts.cash_flow_figure)
+health_gauge_figure = cached_figure(charts.health_gauge_figure)
+expense_pie_figure = cached_figure(charts.expense_pie_figure)
+budget_comparison_figure = cached_figure(charts.budget_comparison_figure)
+goal_forecast_figure = cached_figure(charts.goal_forecast_figure)
+retirement_bands_figure = cached_figure(charts.retirement_bands_figure)
+cached_project_net_worth = cached(project_net_worth)
+net_worth_projection_figure = cached_figure(charts.net_worth_projection_figure)
+debt_payoff_figure = cached_figure(charts.debt_payoff_figure)
+progress_figure = cached_figure(charts.progress_figure)
+sensitivity_heatmap_figure = cached_figure(charts.sensitivity_heatmap_figure)
+
+# Chart builders per backend; the lightweight ones are cached by input like the figures
+CHART_BUILDERS = {
+    "plotly": {"cash_flow": cash_flow_figure, "budget_comparison": budget_comparison_figure, "goal_forecast": goal_forecast_figure},
+    "vega": {"cash_flow": cached(lite_charts.cash_flow_spec), "budget_comparison": cached(lite_charts.budget_comparison_spec),
+             "goal_forecast": cached(lite_charts.goal_forecast_spec)},
+    "svg": {"cash_flow": cached(lite_charts.cash_flow_svg), "budget_comparison": cached(lite_charts.budget_comparison_svg),
+            "goal_forecast": cached(lite_charts.goal_forecast_svg)},
+}
+
+
+def show_chart(chart, *args):
+    # Build and draw one of the CHART_BUILDERS charts with the configured backend
+    built = CHART_BUILDERS[CHART_BACKEND][chart](*args)
+    if CHART_BACKEND == "vega":
+        vega_lite_chart(built, width="stretch")
+    elif CHART_BACKEND == "svg":
+        image(built, width="stretch")
+    else:
+        plotly_chart(built, width="stretch")
+
+# What-if sweep grids, matching the range and step of each forecast slider
+SWEEP_GRIDS = {
+    "Additional Monthly Savings ($)": np.arange(0, 1001, 50),
+    "Expected Annual Return (%)": np.arange(1, 13),
+    "Retirement Age": np.arange(50, 76),
+    "Current Age": np.arange(18, 71),
+}
+
+
+@cached(max_entries=SWEEP_CACHE_MAX_ENTRIES)
+def retirement_sensitivity(retirement_savings, monthly_savings, total_monthly_income):
+    # Retirement income ratio for every SWEEP_GRIDS combination in one broadcast
+    # computation; kept as float32 so the cache entry stays small
+    additional_savings, expected_returns, retirement_ages, current_ages = SWEEP_GRIDS.values()
+    sweep = sensitivity_sweep(retirement_savings, monthly_savings, total_monthly_income,
+                              additional_savings, expected_returns / 100, retirement_ages, current_ages)
+    return sweep["retirement_income_ratio"].astype(np.float32)
+cached_payoff_plan = cached(debt.payoff_plan)
+cached_plan_goals = cached(plan_goals)
+goal_plan_figure = cached_figure(charts.goal_plan_figure)
+cached_minimum_extra_payment = cached(debt.minimum_extra_payment)
+
+
+# Saved snapshots are keyed only by the profile name, with no login, so anyone
+# who types a name sees that profile. They are off unless FINANCIAL_HEALTH_DB
+# names a database; set it only where every visitor may see every profile,
+# such as a local or private deployment
+SNAPSHOT_DB = os.environ.get("FINANCIAL_HEALTH_DB")
+
+
+@st.cache_resource
+def profile_store(path):
+    # One store (and background writer) shared by every session
+    from financial_health.store import ProfileStore
+
+    return ProfileStore(path)
+
+
+# Date formats offered for transaction imports; None guesses from the first date
+TRANSACTION_DATE_FORMATS = {"Detect": None, "YYYY-MM-DD": "%Y-%m-%d", "MM/DD/YYYY": "%m/%d/%Y", "DD/MM/YYYY": "%d/%m/%Y"}
+
+
+@cached
+def import_transactions(file_id, file_name, date_format, _file):
+    # Average monthly spend per category, rounded for the sidebar number inputs.
+    # Keyed on the upload's file_id; the leading underscore keeps Streamlit from
+    # hashing the whole file on every rerun, and the upload is streamed in
+    # chunks rather than copied into memory.
+    # Imported here so pandas is only loaded once a file is uploaded
+    from financial_health.transactions import aggregate_transactions
+
+    file_format = "parquet" if file_name.lower().endswith(".parquet") else "csv"
+    _file.seek(0)
+    averages = aggregate_transactions(_file, file_format, date_format=date_format)
+    return {category: int(round(value)) for category, value in averages.items()}
 
 # Set page configuration
 st.set_page_config(
@@ -58,55 +219,86 @@ and plan for your financial goals. Enter your financial information in the sideb
 # Sidebar for user inputs
 st.sidebar.header("📊 Your Financial Data")
 
+# Saved profiles: entering a name restores the inputs from its latest snapshot
+profile_name = ""
+if SNAPSHOT_DB:
+    profile_name = st.sidebar.text_input("Profile Name", help="Save snapshots under this name to track your progress over time.").strip()
+saved_profile = (profile_store(SNAPSHOT_DB).latest_profile(profile_name) or {}) if profile_name else {}
+
+
+def saved_input(column, default):
+    # A restored value, or the default; snapshots may hold floats, and
+    # number_input needs its value to match the type of its other arguments
+    value = saved_profile.get(column, default)
+    return int(round(value)) if isinstance(default, int) else float(value)
+
+# The scoring inputs are collected here and become one Profile below
+inputs = {}
+
 # Income section
 st.sidebar.subheader("Monthly Income")
-monthly_salary = st.sidebar.number_input("Monthly Salary (After Tax)", min_value=0, value=4000, step=100)
-side_income = st.sidebar.number_input("Side Income / Passive Income", min_value=0, value=500, step=100)
-other_income = st.sidebar.number_input("Other Income", min_value=0, value=0, step=100)
-
-total_monthly_income = monthly_salary + side_income + other_income
+inputs["monthly_salary"] = st.sidebar.number_input("Monthly Salary (After Tax)", min_value=0, value=saved_input("monthly_salary", 4000), step=100)
+inputs["side_income"] = st.sidebar.number_input("Side Income / Passive Income", min_value=0, value=saved_input("side_income", 500), step=100)
+inputs["other_income"] = st.sidebar.number_input("Other Income", min_value=0, value=saved_input("other_income", 0), step=100)
 
 # Expenses section
 st.sidebar.subheader("Monthly Expenses")
-housing = st.sidebar.number_input("Housing (Rent/Mortgage)", min_value=0, value=1200, step=100)
-utilities = st.sidebar.number_input("Utilities", min_value=0, value=200, step=50)
-groceries = st.sidebar.number_input("Groceries", min_value=0, value=400, step=50)
-transportation = st.sidebar.number_input("Transportation", min_value=0, value=300, step=50)
-healthcare = st.sidebar.number_input("Healthcare", min_value=0, value=100, step=50)
-entertainment = st.sidebar.number_input("Entertainment", min_value=0, value=200, step=50)
-other_expenses = st.sidebar.number_input("Other Expenses", min_value=0, value=200, step=50)
 
-total_monthly_expenses = housing + utilities + groceries + transportation + healthcare + entertainment + other_expenses
+# Optional bank export; its monthly averages pre-fill the expense fields below
+transactions_file = st.sidebar.file_uploader(
+    "Import Transactions (CSV or Parquet)", type=["csv", "parquet"],
+    help="Needs date, amount and description columns, with expenses as negative amounts."
+)
+imported_expenses = {}
+if transactions_file is not None:
+    date_format = TRANSACTION_DATE_FORMATS[st.sidebar.selectbox("Transaction Date Format", TRANSACTION_DATE_FORMATS)]
+    try:
+        imported_expenses = import_transactions(transactions_file.file_id, transactions_file.name, date_format, transactions_file)
+    except (ValueError, ImportError) as exc:
+        st.sidebar.error(f"Could not import transactions: {exc}")
+    else:
+        st.sidebar.caption(f"Expenses below are monthly averages from {transactions_file.name}. "
+                           f"Detected debt payments: ${imported_expenses['Debt Payments']:,}/month.")
+
+inputs["housing"] = st.sidebar.number_input("Housing (Rent/Mortgage)", min_value=0, value=imported_expenses.get("Housing", saved_input("housing", 1200)), step=100)
+inputs["utilities"] = st.sidebar.number_input("Utilities", min_value=0, value=imported_expenses.get("Utilities", saved_input("utilities", 200)), step=50)
+inputs["groceries"] = st.sidebar.number_input("Groceries", min_value=0, value=imported_expenses.get("Groceries", saved_input("groceries", 400)), step=50)
+inputs["transportation"] = st.sidebar.number_input("Transportation", min_value=0, value=imported_expenses.get("Transportation", saved_input("transportation", 300)), step=50)
+inputs["healthcare"] = st.sidebar.number_input("Healthcare", min_value=0, value=imported_expenses.get("Healthcare", saved_input("healthcare", 100)), step=50)
+inputs["entertainment"] = st.sidebar.number_input("Entertainment", min_value=0, value=imported_expenses.get("Entertainment", saved_input("entertainment", 200)), step=50)
+inputs["other_expenses"] = st.sidebar.number_input("Other Expenses", min_value=0, value=imported_expenses.get("Other Expenses", saved_input("other_expenses", 200)), step=50)
 
 # Debt section
 st.sidebar.subheader("Outstanding Debts")
-student_loan = st.sidebar.number_input("Student Loan", min_value=0, value=15000, step=1000)
-car_loan = st.sidebar.number_input("Car Loan", min_value=0, value=10000, step=1000)
-credit_card = st.sidebar.number_input("Credit Card Debt", min_value=0, value=2000, step=500)
-mortgage = st.sidebar.number_input("Mortgage Remaining", min_value=0, value=200000, step=10000)
-other_debt = st.sidebar.number_input("Other Debt", min_value=0, value=0, step=1000)
-
-total_debt = student_loan + car_loan + credit_card + mortgage + other_debt
+inputs["student_loan"] = st.sidebar.number_input("Student Loan", min_value=0, value=saved_input("student_loan", 15000), step=1000)
+inputs["car_loan"] = st.sidebar.number_input("Car Loan", min_value=0, value=saved_input("car_loan", 10000), step=1000)
+inputs["credit_card"] = st.sidebar.number_input("Credit Card Debt", min_value=0, value=saved_input("credit_card", 2000), step=500)
+inputs["mortgage"] = st.sidebar.number_input("Mortgage Remaining", min_value=0, value=saved_input("mortgage", 200000), step=10000)
+inputs["other_debt"] = st.sidebar.number_input("Other Debt", min_value=0, value=saved_input("other_debt", 0), step=1000)
 
 # Monthly debt payments
 st.sidebar.subheader("Monthly Debt Payments")
-student_loan_payment = st.sidebar.number_input("Student Loan Payment", min_value=0, value=200, step=50)
-car_loan_payment = st.sidebar.number_input("Car Loan Payment", min_value=0, value=300, step=50)
-credit_card_payment = st.sidebar.number_input("Credit Card Payment", min_value=0, value=200, step=50)
-mortgage_payment = st.sidebar.number_input("Mortgage Payment", min_value=0, value=900, step=50)
-other_debt_payment = st.sidebar.number_input("Other Debt Payment", min_value=0, value=0, step=50)
+inputs["student_loan_payment"] = st.sidebar.number_input("Student Loan Payment", min_value=0, value=saved_input("student_loan_payment", 200), step=50)
+inputs["car_loan_payment"] = st.sidebar.number_input("Car Loan Payment", min_value=0, value=saved_input("car_loan_payment", 300), step=50)
+inputs["credit_card_payment"] = st.sidebar.number_input("Credit Card Payment", min_value=0, value=saved_input("credit_card_payment", 200), step=50)
+inputs["mortgage_payment"] = st.sidebar.number_input("Mortgage Payment", min_value=0, value=saved_input("mortgage_payment", 900), step=50)
+inputs["other_debt_payment"] = st.sidebar.number_input("Other Debt Payment", min_value=0, value=saved_input("other_debt_payment", 0), step=50)
 
-total_debt_payment = student_loan_payment + car_loan_payment + credit_card_payment + mortgage_payment + other_debt_payment
+# Interest rates, used by the debt payoff plan
+st.sidebar.subheader("Debt Interest Rates (APR %)")
+student_loan_rate = st.sidebar.number_input("Student Loan Rate", min_value=0.0, max_value=100.0, value=5.5, step=0.5)
+car_loan_rate = st.sidebar.number_input("Car Loan Rate", min_value=0.0, max_value=100.0, value=7.0, step=0.5)
+credit_card_rate = st.sidebar.number_input("Credit Card Rate", min_value=0.0, max_value=100.0, value=22.0, step=0.5)
+mortgage_rate = st.sidebar.number_input("Mortgage Rate", min_value=0.0, max_value=100.0, value=6.5, step=0.5)
+other_debt_rate = st.sidebar.number_input("Other Debt Rate", min_value=0.0, max_value=100.0, value=8.0, step=0.5)
 
 # Assets section
 st.sidebar.subheader("Assets")
-emergency_fund = st.sidebar.number_input("Emergency Fund", min_value=0, value=10000, step=1000)
-investments = st.sidebar.number_input("Investments", min_value=0, value=50000, step=5000)
-retirement = st.sidebar.number_input("Retirement Accounts", min_value=0, value=40000, step=5000)
-property_value = st.sidebar.number_input("Property Value", min_value=0, value=250000, step=10000)
-other_assets = st.sidebar.number_input("Other Assets", min_value=0, value=5000, step=1000)
-
-total_assets = emergency_fund + investments + retirement + property_value + other_assets
+inputs["emergency_fund"] = st.sidebar.number_input("Emergency Fund", min_value=0, value=saved_input("emergency_fund", 10000), step=1000)
+inputs["investments"] = st.sidebar.number_input("Investments", min_value=0, value=saved_input("investments", 50000), step=5000)
+inputs["retirement"] = st.sidebar.number_input("Retirement Accounts", min_value=0, value=saved_input("retirement", 40000), step=5000)
+inputs["property_value"] = st.sidebar.number_input("Property Value", min_value=0, value=saved_input("property_value", 250000), step=10000)
+inputs["other_assets"] = st.sidebar.number_input("Other Assets", min_value=0, value=saved_input("other_assets", 5000), step=1000)
 
 # Financial goal setting
 st.sidebar.subheader("Financial Goal Setting")
@@ -116,10 +308,54 @@ selected_goal = st.sidebar.selectbox("Select your primary financial goal", goal_
 goal_amount = st.sidebar.number_input("Goal Amount", min_value=0, value=30000, step=1000)
 goal_timeline_years = st.sidebar.slider("Timeline (Years)", min_value=1, max_value=30, value=5)
 
-# Tabs for different sections
-tab1, tab2, tab3, tab4 = st.tabs(["Overview", "Financial Health", "Expense Breakdown", "Financial Forecast"])
+profiler.lap("sidebar inputs")
+
+# Score the profile with the shared scoring engine; its totals are computed once here
+profile = Profile.from_mapping(inputs)
+totals = profile.totals
+rules = rule_set(RULES_PATH)
+metrics = cached_score_profile(profile, RULES_PATH)
+
+if profile_name and st.sidebar.button("Save Snapshot"):
+    # Waits for this snapshot's own write, not for other sessions' saves
+    profile_store(SNAPSHOT_DB).save_snapshot(profile_name, profile, metrics).result()
+    st.sidebar.success(f"Saved today's snapshot for {profile_name}.")
 
-with tab1:
+# Dashboard sections. In lazy mode only the selected section is computed and
+# sent to the browser; set FINANCIAL_HEALTH_LAZY_SECTIONS=0 to render all of
+# them as tabs on every rerun instead
+SECTIONS = ["Overview", "Financial Health", "Expense Breakdown", "Financial Forecast", "Debt Payoff", "Progress"]
+LAZY_SECTIONS = os.environ.get("FINANCIAL_HEALTH_LAZY_SECTIONS", "1") != "0"
+
+# Section widget defaults. Re-assigning them every run keeps their values
+# while their section is hidden in lazy mode
+WIDGET_DEFAULTS = {
+    "goal_return_pct": 0,
+    "goal_resolution": "Annual",
+    "retirement_age": 65,
+    "current_age": 30,
+    "expected_annual_return_pct": 7,
+    "additional_savings": 200,
+    "multi_goal": False,
+    "sensitivity_sweep": False,
+    "sweep_x": "Additional Monthly Savings ($)",
+    "sweep_y": "Expected Annual Return (%)",
+    "monte_carlo": False,
+    "return_volatility_pct": 15,
+    "simulation_paths": 10_000,
+    "net_worth_projection": False,
+    "inflation_pct": 2.5,
+    "salary_growth_pct": 3.0,
+    "contribution_escalation_pct": 0.0,
+    "payoff_strategy": "Avalanche",
+    "extra_debt_payment": 200,
+    "custom_payoff_order": [],
+    "debt_free_target_years": 10,
+}
+for key, default in WIDGET_DEFAULTS.items():
+    st.session_state[key] = st.session_state.get(key, default)
+
+def render_overview():
     # Overview section
     st.markdown("<h2 class='sub-header'>Financial Overview</h2>", unsafe_allow_html=True)
     
@@ -129,217 +365,107 @@ with tab1:
     with col1:
         st.markdown("<div class='metric-card'>", unsafe_allow_html=True)
         st.subheader("Monthly Income")
-        st.markdown(f"<h2>${total_monthly_income:,.2f}</h2>", unsafe_allow_html=True)
+        st.markdown(f"<h2>${totals.total_monthly_income:,.2f}</h2>", unsafe_allow_html=True)
         st.markdown("</div>", unsafe_allow_html=True)
     
     with col2:
         st.markdown("<div class='metric-card'>", unsafe_allow_html=True)
         st.subheader("Monthly Expenses")
-        st.markdown(f"<h2>${total_monthly_expenses:,.2f}</h2>", unsafe_allow_html=True)
+        st.markdown(f"<h2>${totals.total_monthly_expenses:,.2f}</h2>", unsafe_allow_html=True)
         st.markdown("</div>", unsafe_allow_html=True)
     
     with col3:
-        monthly_savings = total_monthly_income - total_monthly_expenses - total_debt_payment
         st.markdown("<div class='metric-card'>", unsafe_allow_html=True)
         st.subheader("Monthly Savings")
-        st.markdown(f"<h2>${monthly_savings:,.2f}</h2>", unsafe_allow_html=True)
+        st.markdown(f"<h2>${totals.monthly_savings:,.2f}</h2>", unsafe_allow_html=True)
         st.markdown("</div>", unsafe_allow_html=True)
     
-    # Net worth calculation
-    net_worth = total_assets - total_debt
-    
     # Display net worth with progress bar
     st.markdown("<h3>Net Worth</h3>", unsafe_allow_html=True)
-    st.progress(min(max(net_worth / (total_assets * 2), 0), 1.0))
+    st.progress(min(max(totals.net_worth / (totals.total_assets * 2), 0), 1.0))
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Total Assets", f"${total_assets:,.2f}", delta=None)
+        st.metric("Total Assets", f"${totals.total_assets:,.2f}", delta=None)
     with col2:
-        st.metric("Total Debt", f"${total_debt:,.2f}", delta=None, delta_color="inverse")
-    st.metric("Net Worth", f"${net_worth:,.2f}")
+        st.metric("Total Debt", f"${totals.total_debt:,.2f}", delta=None, delta_color="inverse")
+    st.metric("Net Worth", f"${totals.net_worth:,.2f}")
     
     # Income vs Expenses chart
     st.markdown("<h3>Income vs Expenses</h3>", unsafe_allow_html=True)
     
-    categories = ['Income', 'Expenses', 'Debt Payments', 'Savings']
-    values = [total_monthly_income, total_monthly_expenses, total_debt_payment, monthly_savings]
-    colors = ['#4CAF50', '#FF9800', '#F44336', '#2196F3']
-    
-    fig = go.Figure(data=[go.Bar(
-        x=categories,
-        y=values,
-        marker_color=colors
-    )])
-    
-    fig.update_layout(
-        title="Monthly Cash Flow",
-        xaxis_title="Category",
-        yaxis_title="Amount ($)",
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart("cash_flow", totals.total_monthly_income, totals.total_monthly_expenses, totals.total_debt_payment, totals.monthly_savings)
 
-with tab2:
+def render_status_legend(name):
+    # Bands of a status indicator, from the active rule table
+    items = "".join(f"<li>{band}: <span class='{category}'>{label}</span></li>" for band, category, label in rules.status_legend(name))
+    st.markdown(f"<ul>{items}</ul>", unsafe_allow_html=True)
+
+def render_financial_health():
     # Financial Health Metrics
     st.markdown("<h2 class='sub-header'>Financial Health Metrics</h2>", unsafe_allow_html=True)
     
-    # Calculate key financial health metrics
-    savings_rate = (monthly_savings / total_monthly_income) * 100 if total_monthly_income > 0 else 0
-    debt_to_income = (total_debt_payment / total_monthly_income) * 100 if total_monthly_income > 0 else 0
-    housing_to_income = (housing / total_monthly_income) * 100 if total_monthly_income > 0 else 0
-    emergency_months = emergency_fund / total_monthly_expenses if total_monthly_expenses > 0 else 0
-    debt_to_asset = (total_debt / total_assets) * 100 if total_assets > 0 else 0
-    
-    # Function to get health status and color
-    def get_health_status(value, thresholds, categories):
-        for i, threshold in enumerate(thresholds):
-            if value <= threshold:
-                return categories[i]
-        return categories[-1]
+    # Key financial health metrics
+    savings_rate = metrics["savings_rate"]
+    debt_to_income = metrics["debt_to_income"]
+    housing_to_income = metrics["housing_to_income"]
+    emergency_months = metrics["emergency_months"]
+    debt_to_asset = metrics["debt_to_asset"]
     
     # Display metrics with health indicators
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("<h3>Savings Rate</h3>", unsafe_allow_html=True)
-        savings_status = get_health_status(savings_rate, [0, 10, 20], ["danger", "warning", "good"])
+        savings_status = metrics["savings_status"]
         st.markdown(f"<h2 class='{savings_status}'>{savings_rate:.1f}%</h2>", unsafe_allow_html=True)
-        st.markdown("""
-        <ul>
-            <li>Less than 10%: <span class='danger'>Danger</span></li>
-            <li>10-20%: <span class='warning'>Caution</span></li>
-            <li>Over 20%: <span class='good'>Excellent</span></li>
-        </ul>
-        """, unsafe_allow_html=True)
+        render_status_legend("savings_status")
         
         st.markdown("<h3>Debt-to-Income Ratio</h3>", unsafe_allow_html=True)
-        dti_status = get_health_status(debt_to_income, [0, 28, 36], ["good", "warning", "danger"])
+        dti_status = metrics["dti_status"]
         st.markdown(f"<h2 class='{dti_status}'>{debt_to_income:.1f}%</h2>", unsafe_allow_html=True)
-        st.markdown("""
-        <ul>
-            <li>Less than 28%: <span class='good'>Good</span></li>
-            <li>28-36%: <span class='warning'>Caution</span></li>
-            <li>Over 36%: <span class='danger'>High Risk</span></li>
-        </ul>
-        """, unsafe_allow_html=True)
+        render_status_legend("dti_status")
     
     with col2:
         st.markdown("<h3>Emergency Fund</h3>", unsafe_allow_html=True)
-        emergency_status = get_health_status(emergency_months, [0, 3, 6], ["danger", "warning", "good"])
+        emergency_status = metrics["emergency_status"]
         st.markdown(f"<h2 class='{emergency_status}'>{emergency_months:.1f} months</h2>", unsafe_allow_html=True)
-        st.markdown("""
-        <ul>
-            <li>Less than 3 months: <span class='danger'>Danger</span></li>
-            <li>3-6 months: <span class='warning'>Building</span></li>
-            <li>Over 6 months: <span class='good'>Secure</span></li>
-        </ul>
-        """, unsafe_allow_html=True)
+        render_status_legend("emergency_status")
         
         st.markdown("<h3>Housing Cost Ratio</h3>", unsafe_allow_html=True)
-        housing_status = get_health_status(housing_to_income, [0, 25, 33], ["good", "warning", "danger"])
+        housing_status = metrics["housing_status"]
         st.markdown(f"<h2 class='{housing_status}'>{housing_to_income:.1f}%</h2>", unsafe_allow_html=True)
-        st.markdown("""
-        <ul>
-            <li>Less than 25%: <span class='good'>Affordable</span></li>
-            <li>25-33%: <span class='warning'>Moderate</span></li>
-            <li>Over 33%: <span class='danger'>Cost Burdened</span></li>
-        </ul>
-        """, unsafe_allow_html=True)
+        render_status_legend("housing_status")
     
     # Financial Health Gauge Chart
     st.markdown("<h3>Overall Financial Health Score</h3>", unsafe_allow_html=True)
     
-    # Calculate overall financial health score (0-100)
-    savings_score = min(savings_rate / 30 * 25, 25)  # 25% weight
-    debt_score = min(max(0, (50 - debt_to_income) / 50 * 25), 25)  # 25% weight
-    emergency_score = min(emergency_months / 12 * 25, 25)  # 25% weight
-    housing_score = min(max(0, (40 - housing_to_income) / 40 * 15), 15)  # 15% weight
-    net_worth_score = min(max(0, net_worth / (total_monthly_income * 12 * 10) * 10), 10)  # 10% weight
-    
-    financial_health_score = savings_score + debt_score + emergency_score + housing_score + net_worth_score
+    # Overall financial health score (0-100)
+    financial_health_score = metrics["financial_health_score"]
     
     # Create gauge chart for financial health score
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = financial_health_score,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': "Financial Health Score"},
-        gauge = {
-            'axis': {'range': [0, 100]},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, 30], 'color': "#F44336"},
-                {'range': [30, 60], 'color': "#FFC107"},
-                {'range': [60, 100], 'color': "#4CAF50"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': financial_health_score
-            }
-        }
-    ))
-    
-    st.plotly_chart(fig, use_container_width=True)
+    fig = health_gauge_figure(financial_health_score)
+    
+    plotly_chart(fig, width="stretch")
     
     # Financial health recommendations based on scores
     st.markdown("<h3>Personalized Recommendations</h3>", unsafe_allow_html=True)
     
-    recommendations = []
-    
-    if savings_rate < 10:
-        recommendations.append("Increase your savings rate to at least 10% by cutting non-essential expenses.")
-    elif savings_rate < 20:
-        recommendations.append("Consider boosting your savings rate to 20% to build wealth faster.")
-    
-    if debt_to_income > 36:
-        recommendations.append("Your debt payments are too high relative to income. Focus on paying down high-interest debt.")
-    elif debt_to_income > 28:
-        recommendations.append("Work on reducing your debt-to-income ratio to less than 28% for better financial health.")
-    
-    if emergency_months < 3:
-        recommendations.append("Build your emergency fund to cover at least 3 months of expenses.")
-    elif emergency_months < 6:
-        recommendations.append("Continue building your emergency fund to reach a 6-month safety net.")
-    
-    if housing_to_income > 33:
-        recommendations.append("Your housing costs are high relative to your income. Consider ways to reduce housing expenses.")
-    
-    if credit_card > 0:
-        recommendations.append("Prioritize paying off high-interest credit card debt as quickly as possible.")
-    
-    if not recommendations:
-        recommendations.append("Great job! Your financial health is strong. Consider increasing investments for long-term wealth.")
+    recommendations = health_recommendations(savings_rate, debt_to_income, emergency_months, housing_to_income, profile.credit_card, rules)
     
     for i, rec in enumerate(recommendations, 1):
         st.markdown(f"{i}. {rec}")
 
-with tab3:
+def render_expense_breakdown():
     # Expense Breakdown
     st.markdown("<h2 class='sub-header'>Expense Breakdown</h2>", unsafe_allow_html=True)
     
     # Create pie chart for expenses
-    expense_labels = ['Housing', 'Utilities', 'Groceries', 'Transportation', 'Healthcare', 'Entertainment', 'Other Expenses', 'Debt Payments']
-    expense_values = [housing, utilities, groceries, transportation, healthcare, entertainment, other_expenses, total_debt_payment]
+    expense_labels = EXPENSE_LABELS
+    expense_values = [profile.housing, profile.utilities, profile.groceries, profile.transportation, profile.healthcare, profile.entertainment, profile.other_expenses, totals.total_debt_payment]
     
-    # Filter out zero values
-    non_zero_labels = [label for label, value in zip(expense_labels, expense_values) if value > 0]
-    non_zero_values = [value for value in expense_values if value > 0]
+    fig = expense_pie_figure(expense_labels, expense_values)
     
-    # Create pie chart
-    fig = px.pie(
-        values=non_zero_values,
-        names=non_zero_labels,
-        title="Monthly Expenses Breakdown",
-        hole=0.4,
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
-    
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(height=500)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, width="stretch")
     
     # Expense comparison to 50/30/20 rule
     st.markdown("<h3>Expense Analysis: 50/30/20 Rule</h3>", unsafe_allow_html=True)
@@ -351,174 +477,249 @@ with tab3:
     """)
     
     # Calculate current percentages
-    needs = (housing + utilities + groceries + transportation + healthcare) / total_monthly_income * 100 if total_monthly_income > 0 else 0
-    wants = entertainment / total_monthly_income * 100 if total_monthly_income > 0 else 0
-    savings_debt = (monthly_savings + total_debt_payment) / total_monthly_income * 100 if total_monthly_income > 0 else 0
-    
-    # Display current percentages vs. ideal
-    comparison_data = {
-        'Category': ['Needs', 'Wants', 'Savings & Debt'],
-        'Current (%)': [needs, wants, savings_debt],
-        'Ideal (%)': [50, 30, 20]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
+    needs = metrics["needs"]
+    wants = metrics["wants"]
+    savings_debt = metrics["savings_debt"]
     
-    # Create bar chart for comparison
-    fig = go.Figure(data=[
-        go.Bar(name='Current', x=df_comparison['Category'], y=df_comparison['Current (%)']),
-        go.Bar(name='Ideal', x=df_comparison['Category'], y=df_comparison['Ideal (%)'])
-    ])
-    
-    fig.update_layout(
-        barmode='group',
-        title='Your Budget vs. 50/30/20 Rule',
-        xaxis_title='Category',
-        yaxis_title='Percentage of Income (%)',
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart("budget_comparison", needs, wants, savings_debt)
     
     # Budget optimization suggestions
     st.markdown("<h3>Budget Optimization Suggestions</h3>", unsafe_allow_html=True)
     
-    budget_recommendations = []
-    
-    if needs > 50:
-        budget_recommendations.append(f"Your essential expenses (needs) are {needs:.1f}% of income, which is above the recommended 50%. Consider finding ways to reduce housing, transportation, or utility costs.")
-    
-    if wants > 30:
-        budget_recommendations.append(f"Your discretionary spending (wants) is {wants:.1f}% of income, above the recommended 30%. Try cutting back on entertainment and non-essential purchases.")
-    
-    if savings_debt < 20:
-        budget_recommendations.append(f"You're only allocating {savings_debt:.1f}% to savings and debt repayment, below the recommended 20%. Increase this allocation to build long-term wealth.")
+    recommendations = budget_recommendations(needs, wants, savings_debt, expense_values, rules)
     
-    highest_expense_category = expense_labels[expense_values.index(max(expense_values))]
-    budget_recommendations.append(f"Your highest expense category is {highest_expense_category}. Look for ways to optimize this area of your budget.")
-    
-    for i, rec in enumerate(budget_recommendations, 1):
+    for i, rec in enumerate(recommendations, 1):
         st.markdown(f"{i}. {rec}")
 
-with tab4:
+GOAL_PLAN_COLUMNS = {
+    "Goal": st.column_config.TextColumn("Goal", required=True),
+    "Amount": st.column_config.NumberColumn("Amount ($)", min_value=0, step=500, format="$%d"),
+    "Deadline": st.column_config.NumberColumn("Deadline (years)", min_value=0.5, max_value=50, step=0.5),
+    "Priority": st.column_config.NumberColumn("Priority (1 = first)", min_value=1, max_value=10, step=1),
+    "Saved": st.column_config.NumberColumn("Already Saved ($)", min_value=0, step=500, format="$%d"),
+}
+
+
+def default_goal_plan():
+    # The sidebar goal first, then an emergency fund covering six months of expenses
+    goals = {"Goal": [selected_goal], "Amount": [goal_amount], "Deadline": [goal_timeline_years], "Priority": [1], "Saved": [0]}
+    if selected_goal != "Build Emergency Fund":
+        for column, value in [("Goal", "Build Emergency Fund"), ("Amount", round(6 * totals.total_monthly_expenses)),
+                              ("Deadline", 2), ("Priority", 2), ("Saved", profile.emergency_fund)]:
+            goals[column].append(value)
+    return goals
+
+
+def apply_goal_plan_edits():
+    # Fold the editor's pending edits into the stored table. The editor then
+    # gets the new table as its data, which starts it with a clean edit state
+    goals = st.session_state["goal_plan"]
+    edits = st.session_state["goal_plan_editor"]
+    rows = [dict(zip(goals, values)) for values in zip(*goals.values())]
+    for index, changes in edits["edited_rows"].items():
+        rows[int(index)].update(changes)
+    rows += [{column: row.get(column) for column in goals} for row in edits["added_rows"]]
+    deleted = set(edits["deleted_rows"])
+    rows = [row for index, row in enumerate(rows) if index not in deleted]
+    st.session_state["goal_plan"] = {column: [row[column] for row in rows] for column in goals}
+
+
+def render_goal_plan(goal_return):
+    goal_budget = max(totals.monthly_savings, 0) * (1 - RETIREMENT_SHARE)
+    st.caption(f"{1 - RETIREMENT_SHARE:.0%} of your monthly savings (${goal_budget:,.2f}) is shared between these goals; "
+               "the rest is assumed to go to retirement, as in the retirement projection below. Goals get what they need "
+               "to meet their deadline in priority order, and any money left over speeds up the highest-priority goals.")
+    
+    # The table is kept in session state so edits survive switching sections;
+    # the callback stores each edit before the rerun that draws it
+    goals = st.session_state.setdefault("goal_plan", default_goal_plan())
+    st.data_editor(goals, key="goal_plan_editor", on_change=apply_goal_plan_edits, num_rows="dynamic",
+                   width="stretch", column_config=GOAL_PLAN_COLUMNS)
+    
+    # Rows without an amount are skipped; other blank cells get defaults
+    names, amounts, deadlines, priorities, saved = [], [], [], [], []
+    for i, (name, amount, deadline, priority, already_saved) in enumerate(zip(*(goals[column] for column in GOAL_PLAN_COLUMNS)), 1):
+        if amount:
+            names.append(name or f"Goal {i}")
+            amounts.append(amount)
+            deadlines.append(deadline or 1)
+            priorities.append(priority or 1)
+            saved.append(already_saved or 0)
+    if not names:
+        st.info("Add a goal with an amount to see a plan.")
+        return
+    if goal_budget <= 0:
+        st.warning("You have no monthly savings to put towards these goals. Increase your income or reduce expenses first.")
+        return
+    
+    plan = cached_plan_goals(goal_budget, amounts, [years * 12 for years in deadlines], priorities, saved, goal_return)
+    plotly_chart(goal_plan_figure(plan.contributions, names), width="stretch")
+    
+    first_month = plan.contributions[0] if len(plan.contributions) else np.zeros(len(names))
+    st.dataframe({
+        "Goal": names,
+        "Deadline (years)": deadlines,
+        "Funded in (years)": [round(month / 12, 1) if np.isfinite(month) else None for month in plan.completion_month],
+        "On Track": ["Yes" if on_track else "No" for on_track in plan.on_track],
+        "First Monthly Contribution ($)": np.round(first_month, 2),
+    }, width="stretch", hide_index=True)
+    
+    missed = int((~plan.on_track).sum())
+    if missed:
+        st.warning(f"{missed} of {len(names)} goals miss their deadline with ${goal_budget:,.2f}/month. "
+                   "Consider extending deadlines, lowering amounts or increasing your savings.")
+    else:
+        st.success("Every goal is funded by its deadline.")
+
+def render_financial_forecast():
     # Financial Forecast
     st.markdown("<h2 class='sub-header'>Financial Forecast</h2>", unsafe_allow_html=True)
     
     # Goal-based forecasting
     st.markdown(f"<h3>Timeline for {selected_goal}</h3>", unsafe_allow_html=True)
     
+    col1, col2 = st.columns(2)
+    with col1:
+        goal_return = st.slider("Return on Goal Savings (%)", min_value=0, max_value=12, key="goal_return_pct",
+                                help="Leave at 0 to assume savings are kept in cash.") / 100
+    with col2:
+        goal_resolution = st.radio("Projection Resolution", ["Annual", "Monthly"], horizontal=True, key="goal_resolution")
+    
     # Basic calculations for forecast based on current savings
-    annual_savings = monthly_savings * 12
+    goal = {key: value.item() for key, value in goal_forecast(totals.monthly_savings, goal_amount, goal_timeline_years, goal_return).items()}
+    annual_savings = goal["annual_savings"]
     
     if annual_savings <= 0:
         st.warning("Your current savings rate is too low to achieve your goal. Please increase your monthly savings.")
     else:
-        years_to_goal = goal_amount / annual_savings
-        
-        # Forecast data
-        years = list(range(int(np.ceil(years_to_goal)) + 1))
-        forecast_savings = [annual_savings * year for year in years]
-        
-        # Create goal line
-        goal_line = [goal_amount] * len(years)
-        
-        # Create forecast plot
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=forecast_savings,
-            mode='lines+markers',
-            name='Projected Savings',
-            line=dict(color='#2196F3', width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=goal_line,
-            mode='lines',
-            name='Goal Amount',
-            line=dict(color='#F44336', width=2, dash='dash')
-        ))
-        
-        fig.update_layout(
-            title=f"Savings Projection for {selected_goal}",
-            xaxis_title='Years',
-            yaxis_title='Amount ($)',
-            height=400
-        )
+        years_to_goal = goal["years_to_goal"]
         
-        st.plotly_chart(fig, use_container_width=True)
+        # Forecast chart; the projection is capped and downsampled so its size
+        # doesn't depend on how far away the goal is
+        years, projected_savings, capped = goal_projection(totals.monthly_savings, goal_amount, years_to_goal, goal_return, goal_resolution.lower())
+        show_chart("goal_forecast", years, projected_savings, goal_amount, selected_goal)
+        if capped:
+            st.caption(f"Projection shown for the first {years[-1]:.0f} years only.")
         
-        if years_to_goal <= goal_timeline_years:
-            st.success(f"Based on your current savings rate of ${monthly_savings:.2f}/month, you'll reach your goal of ${goal_amount:,.2f} in {years_to_goal:.1f} years, which is within your {goal_timeline_years} year timeline.")
+        if goal["goal_on_track"]:
+            st.success(f"Based on your current savings rate of ${totals.monthly_savings:.2f}/month, you'll reach your goal of ${goal_amount:,.2f} in {years_to_goal:.1f} years, which is within your {goal_timeline_years} year timeline.")
         else:
-            st.warning(f"Based on your current savings rate of ${monthly_savings:.2f}/month, it will take {years_to_goal:.1f} years to reach your goal of ${goal_amount:,.2f}, which exceeds your {goal_timeline_years} year timeline.")
+            st.warning(f"Based on your current savings rate of ${totals.monthly_savings:.2f}/month, it will take {years_to_goal:.1f} years to reach your goal of ${goal_amount:,.2f}, which exceeds your {goal_timeline_years} year timeline.")
             
-            # Calculate required monthly savings to meet timeline
-            required_monthly_savings = goal_amount / (goal_timeline_years * 12)
-            savings_gap = required_monthly_savings - monthly_savings
+            # Required monthly savings to meet timeline
+            required_monthly_savings = goal["required_monthly_savings"]
+            savings_gap = goal["savings_gap"]
             
             st.info(f"To meet your {goal_timeline_years}-year timeline, you need to save ${required_monthly_savings:.2f}/month, which is ${savings_gap:.2f} more than your current monthly savings.")
     
+    # Several goals at once, sharing the savings not set aside for retirement
+    st.markdown("<h3>Multi-Goal Plan</h3>", unsafe_allow_html=True)
+    
+    if st.toggle("Plan several goals", key="multi_goal"):
+        render_goal_plan(goal_return)
+    
     # Retirement forecast (simplified)
     st.markdown("<h3>Retirement Planning</h3>", unsafe_allow_html=True)
     
-    retirement_age = st.slider("Expected Retirement Age", min_value=50, max_value=75, value=65)
-    current_age = st.slider("Current Age", min_value=18, max_value=70, value=30)
-    expected_annual_return = st.slider("Expected Annual Return (%)", min_value=1, max_value=12, value=7) / 100
+    retirement_age = st.slider("Expected Retirement Age", min_value=50, max_value=75, key="retirement_age")
+    current_age = st.slider("Current Age", min_value=18, max_value=70, key="current_age")
+    expected_annual_return = st.slider("Expected Annual Return (%)", min_value=1, max_value=12, key="expected_annual_return_pct") / 100
     
     years_to_retirement = retirement_age - current_age
     
-    # Calculate current retirement savings and monthly contribution
-    annual_retirement_contribution = monthly_savings * 0.5 * 12  # Assume 50% of savings goes to retirement
-    
-    # Calculate future value of current retirement savings
-    future_retirement_savings = retirement * (1 + expected_annual_return) ** years_to_retirement
-    
-    # Calculate future value of retirement contributions
-    future_value_contributions = annual_retirement_contribution * (((1 + expected_annual_return) ** years_to_retirement - 1) / expected_annual_return)
-    
-    total_retirement_savings = future_retirement_savings + future_value_contributions
+    # Project retirement savings, assuming 50% of monthly savings goes to retirement
+    projection = {key: value.item() for key, value in project_retirement(
+        profile.retirement, totals.monthly_savings, totals.total_monthly_income, years_to_retirement, expected_annual_return
+    ).items()}
+    annual_retirement_contribution = projection["annual_retirement_contribution"]
+    total_retirement_savings = projection["total_retirement_savings"]
     
     # Display retirement forecast
     st.markdown(f"Estimated retirement savings at age {retirement_age}: **${total_retirement_savings:,.2f}**")
     
-    # Calculate withdrawal rate and monthly retirement income
-    withdrawal_rate = 0.04  # 4% rule
-    annual_retirement_income = total_retirement_savings * withdrawal_rate
-    monthly_retirement_income = annual_retirement_income / 12
+    # Monthly retirement income from the withdrawal rate
+    withdrawal_rate = WITHDRAWAL_RATE
+    monthly_retirement_income = projection["monthly_retirement_income"]
     
     st.markdown(f"Estimated monthly retirement income (4% withdrawal rate): **${monthly_retirement_income:,.2f}**")
     
     # Retirement income comparison
-    retirement_income_ratio = monthly_retirement_income / total_monthly_income * 100 if total_monthly_income > 0 else 0
+    retirement_income_ratio = projection["retirement_income_ratio"]
     
     st.progress(min(retirement_income_ratio / 100, 1.0))
     st.markdown(f"This retirement income would be **{retirement_income_ratio:.1f}%** of your current monthly income.")
     
-    if retirement_income_ratio < 70:
+    if not projection["retirement_on_track"]:
         st.warning("Your projected retirement income is less than 70% of your current income. Consider increasing your retirement contributions.")
     else:
         st.success("Your projected retirement income is on track to replace a sufficient portion of your current income.")
     
+    # Stochastic mode: simulate many market return paths instead of one fixed return
+    if st.toggle("Monte Carlo simulation", key="monte_carlo"):
+        col1, col2 = st.columns(2)
+        with col1:
+            return_volatility = st.slider("Return Volatility (%)", min_value=0, max_value=30, key="return_volatility_pct") / 100
+        with col2:
+            simulation_paths = st.select_slider("Simulated Paths", options=[10_000, 25_000, 50_000, 100_000], key="simulation_paths")
+        
+        # Balance needed to replace 70% of current income with the same withdrawal rate
+        target_balance = 0.7 * totals.total_monthly_income * 12 / withdrawal_rate
+        simulation = retirement_simulation(
+            profile.retirement, annual_retirement_contribution, years_to_retirement, expected_annual_return, return_volatility,
+            n_paths=simulation_paths, target_balance=target_balance, seed=0
+        )
+        
+        st.metric("Chance of Replacing 70% of Current Income", f"{simulation.success_probability:.1%}")
+        fig = retirement_bands_figure(simulation.years + current_age, simulation.percentiles)
+        plotly_chart(fig, width="stretch")
+    
+    # Long-horizon mode: every asset and debt month by month, with inflation
+    # and pay rises, compared against the salary at retirement
+    if st.toggle("Long-term net worth projection", key="net_worth_projection"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            inflation = st.slider("Inflation (%)", min_value=0.0, max_value=10.0, step=0.5, key="inflation_pct") / 100
+        with col2:
+            salary_growth = st.slider("Salary Growth (%)", min_value=0.0, max_value=10.0, step=0.5, key="salary_growth_pct") / 100
+        with col3:
+            contribution_escalation = st.slider("Contribution Escalation (%)", min_value=0.0, max_value=10.0, step=0.5,
+                                                key="contribution_escalation_pct",
+                                                help="Yearly rise in your savings on top of salary growth.") / 100
+        
+        contribution_years = max(years_to_retirement, 0)
+        long_term = cached_project_net_worth(
+            profile, max(PROJECTION_YEARS, contribution_years), inflation=inflation, salary_growth=salary_growth,
+            contribution_escalation=contribution_escalation, contribution_years=contribution_years,
+            asset_returns={"investments": expected_annual_return, "retirement": expected_annual_return},
+            debt_rates={"student_loan": student_loan_rate / 100, "car_loan": car_loan_rate / 100, "credit_card": credit_card_rate / 100,
+                        "mortgage": mortgage_rate / 100, "other_debt": other_debt_rate / 100},
+        )
+        
+        # Retirement income in today's dollars, against the salary by then
+        at_retirement = contribution_years * 12
+        retirement_balance = long_term.assets["retirement"][at_retirement]
+        price_level = long_term.price_level[at_retirement]
+        income_at_retirement = long_term.monthly_income[at_retirement]
+        replacement = retirement_balance * withdrawal_rate / 12 / income_at_retirement * 100 if income_at_retirement > 0 else 0.0
+        st.markdown(f"Net worth at age {current_age + contribution_years}: **${long_term.net_worth[at_retirement]:,.0f}** "
+                    f"(**${long_term.real_net_worth[at_retirement]:,.0f}** in today's dollars).")
+        st.markdown(f"Retirement accounts would then pay **${retirement_balance * withdrawal_rate / 12 / price_level:,.2f}/month** "
+                    f"in today's dollars, **{replacement:.1f}%** of your salary by then.")
+        
+        # Yearly points are plenty for a 50-year chart
+        fig = net_worth_projection_figure(current_age + long_term.months[::12] / 12, long_term.net_worth[::12],
+                                          long_term.real_net_worth[::12], retirement_age)
+        plotly_chart(fig, width="stretch")
+    
     # What-if scenario for increased savings
     st.markdown("<h3>What-If Scenario: Increase Savings</h3>", unsafe_allow_html=True)
     
-    additional_savings = st.slider("Additional Monthly Savings ($)", min_value=0, max_value=1000, value=200, step=50)
-    
-    # Calculate new total savings
-    new_monthly_savings = monthly_savings + additional_savings
-    new_annual_retirement_contribution = (monthly_savings + additional_savings) * 0.5 * 12
-    
-    # Calculate new future value of retirement contributions
-    new_future_value_contributions = new_annual_retirement_contribution * (((1 + expected_annual_return) ** years_to_retirement - 1) / expected_annual_return)
-    
-    new_total_retirement_savings = future_retirement_savings + new_future_value_contributions
+    additional_savings = st.slider("Additional Monthly Savings ($)", min_value=0, max_value=1000, step=50, key="additional_savings")
     
-    # Calculate new monthly retirement income
-    new_annual_retirement_income = new_total_retirement_savings * withdrawal_rate
-    new_monthly_retirement_income = new_annual_retirement_income / 12
+    # Same projection with the additional savings
+    new_monthly_savings = totals.monthly_savings + additional_savings
+    what_if = project_retirement(profile.retirement, new_monthly_savings, totals.total_monthly_income, years_to_retirement, expected_annual_return)
+    new_monthly_retirement_income = what_if["monthly_retirement_income"].item()
     
     # Calculate increase
     retirement_income_increase = new_monthly_retirement_income - monthly_retirement_income
@@ -526,6 +727,162 @@ with tab4:
     
     st.markdown(f"By saving an additional **${additional_savings}/month**, your projected monthly retirement income would increase by **${retirement_income_increase:,.2f}** to **${new_monthly_retirement_income:,.2f}** (a **{retirement_income_increase_percent:.1f}%** increase).")
     
+    # Sweep mode: the whole what-if grid at once, sliced to the two chosen
+    # parameters with the other two held at their current slider values
+    if st.toggle("Sensitivity sweep", key="sensitivity_sweep"):
+        parameters = list(SWEEP_GRIDS)
+        col1, col2 = st.columns(2)
+        with col1:
+            x_parameter = st.selectbox("Heatmap X Axis", parameters, key="sweep_x")
+        with col2:
+            y_parameter = st.selectbox("Heatmap Y Axis", parameters, key="sweep_y")
+        
+        ratio = retirement_sensitivity(profile.retirement, totals.monthly_savings, totals.total_monthly_income)
+        on_track_share = np.mean(ratio[~np.isnan(ratio)] >= INCOME_REPLACEMENT_TARGET)
+        st.caption(f"{on_track_share:.0%} of the {ratio.size:,} combinations replace at least {INCOME_REPLACEMENT_TARGET}% of your current income.")
+        
+        if x_parameter == y_parameter:
+            st.warning("Choose two different parameters for the heatmap.")
+        else:
+            current_values = [additional_savings, round(expected_annual_return * 100), retirement_age, current_age]
+            index = tuple(
+                slice(None) if parameter in (x_parameter, y_parameter) else int(np.searchsorted(grid, value))
+                for (parameter, grid), value in zip(SWEEP_GRIDS.items(), current_values)
+            )
+            z = ratio[index]
+            if parameters.index(x_parameter) < parameters.index(y_parameter):
+                z = z.T
+            fig = sensitivity_heatmap_figure(SWEEP_GRIDS[x_parameter], SWEEP_GRIDS[y_parameter], z, x_parameter, y_parameter,
+                                             INCOME_REPLACEMENT_TARGET)
+            plotly_chart(fig, width="stretch")
+    
+def render_debt_payoff():
+    # Debt payoff plan
+    st.markdown("<h2 class='sub-header'>Debt Payoff Plan</h2>", unsafe_allow_html=True)
+    
+    if totals.total_debt <= 0:
+        st.success("You have no outstanding debt. Great job!")
+        return
+    
+    debt_balances = [profile.student_loan, profile.car_loan, profile.credit_card, profile.mortgage, profile.other_debt]
+    debt_rates = [rate / 100 for rate in [student_loan_rate, car_loan_rate, credit_card_rate, mortgage_rate, other_debt_rate]]
+    debt_payments = [profile.student_loan_payment, profile.car_loan_payment, profile.credit_card_payment, profile.mortgage_payment, profile.other_debt_payment]
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        strategy = st.selectbox("Payoff Strategy", debt.STRATEGIES, key="payoff_strategy",
+                                help="Avalanche pays the highest interest rate first, Snowball the smallest balance first.")
+    with col2:
+        extra_debt_payment = st.slider("Extra Monthly Debt Payment ($)", min_value=0, max_value=2000, step=50, key="extra_debt_payment")
+    
+    custom_order = None
+    if strategy == "Custom":
+        custom_names = st.multiselect("Payoff Order (first = paid off first)", debt.DEBT_NAMES, key="custom_payoff_order")
+        custom_order = [debt.DEBT_NAMES.index(name) for name in custom_names]
+    
+    # Scenario 0 is minimum payments only, scenario 1 the plan with the extra payment
+    plan = cached_payoff_plan(debt_balances, debt_rates, debt_payments, extra_debt_payment, strategy, custom_order)
+    baseline_months, plan_months = plan.months_to_payoff
+    baseline_interest, plan_interest = plan.total_interest
+    
+    if np.isinf(plan_months):
+        st.warning("Your debt payments don't cover the interest on at least one debt, so it will never be paid off. Increase your payments.")
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Debt-Free In", f"{int(plan_months) // 12} yrs {int(plan_months) % 12} mos")
+        with col2:
+            st.metric("Total Interest", f"${plan_interest:,.2f}")
+        with col3:
+            interest_saved = baseline_interest - plan_interest if np.isfinite(baseline_months) else None
+            st.metric("Interest Saved", f"${interest_saved:,.2f}" if interest_saved is not None else "n/a")
+        
+        fig = debt_payoff_figure(plan.balances[:, 1, :], debt.DEBT_NAMES)
+        plotly_chart(fig, width="stretch")
+        
+        # Payoff order with the month each debt is cleared
+        order = [index for index in debt.payoff_order(debt_balances, debt_rates, strategy, custom_order) if debt_balances[index] > 0]
+        for i, index in enumerate(order, 1):
+            st.markdown(f"{i}. {debt.DEBT_NAMES[index]}: paid off in month {int(plan.payoff_month[1, index])}")
+    
+    # Smallest extra payment that meets a debt-free target
+    st.markdown("<h3>Optimal Extra Payment</h3>", unsafe_allow_html=True)
+    
+    target_years = st.slider("Debt-Free Target (Years)", min_value=1, max_value=30, key="debt_free_target_years")
+    required_extra = cached_minimum_extra_payment(debt_balances, debt_rates, debt_payments, target_years * 12, strategy, custom_order)
+    
+    if required_extra is None:
+        st.warning(f"Even an extra $10,000/month would not clear your debt within {target_years} years.")
+    elif required_extra == 0:
+        st.success(f"Your current payments already clear all debt within {target_years} years.")
+    else:
+        st.info(f"To be debt-free within {target_years} years using the {strategy} strategy, pay an extra **${required_extra:,.0f}/month**.")
+    
+def render_progress():
+    # Progress tracking from saved snapshots
+    st.markdown("<h2 class='sub-header'>Your Progress</h2>", unsafe_allow_html=True)
+    
+    if not SNAPSHOT_DB:
+        st.info("Progress tracking is off on this deployment, as saved profiles are not protected by a login. "
+                "Run the app with FINANCIAL_HEALTH_DB set to track your progress.")
+        return
+    if not profile_name:
+        st.info("Enter a profile name in the sidebar and save snapshots to track your progress over time.")
+        return
+    
+    history = profile_store(SNAPSHOT_DB).progress(profile_name)
+    if len(history["dates"]) == 0:
+        st.info(f"No snapshots saved for {profile_name} yet. Use **Save Snapshot** in the sidebar.")
+        return
+    
+    first_net_worth, latest_net_worth = history["net_worth"][0], history["net_worth"][-1]
+    first_score, latest_score = history["financial_health_score"][0], history["financial_health_score"][-1]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Net Worth", f"${latest_net_worth:,.2f}", delta=f"${latest_net_worth - first_net_worth:,.2f}")
+    with col2:
+        st.metric("Financial Health Score", f"{latest_score:.0f}/100", delta=f"{latest_score - first_score:.0f}")
+    st.caption(f"Change since {history['dates'][0]}; one snapshot per month is shown.")
+    
+    fig = progress_figure(history["dates"], history["net_worth"], history["financial_health_score"])
+    plotly_chart(fig, width="stretch")
+    
+SECTION_RENDERERS = {
+    "Overview": render_overview,
+    "Financial Health": render_financial_health,
+    "Expense Breakdown": render_expense_breakdown,
+    "Financial Forecast": render_financial_forecast,
+    "Debt Payoff": render_debt_payoff,
+    "Progress": render_progress,
+}
+
+if LAZY_SECTIONS:
+    selected_section = st.radio("Section", SECTIONS, horizontal=True, key="section", label_visibility="collapsed")
+    with profiler.timed(f"section: {selected_section}"):
+        SECTION_RENDERERS[selected_section]()
+else:
+    for tab, section in zip(st.tabs(SECTIONS), SECTIONS):
+        with tab, profiler.timed(f"section: {section}"):
+            SECTION_RENDERERS[section]()
+
 # Add footer with creator information
 st.markdown("---")
-st.markdown("Financial Health Dashboard | Created for AF3005 – Programming for Finance | Dr. Usama Arshad")
\ No newline at end of file
+st.markdown("Financial Health Dashboard | Created for AF3005 – Programming for Finance | Dr. Usama Arshad")
+
+
+# Hidden debug panel and structured timing log, only when profiling is enabled
+if profiler.enabled:
+    timing_record = profiler.export(os.environ.get("FINANCIAL_HEALTH_PROFILE_LOG"),
+                                    section=selected_section if LAZY_SECTIONS else "all")
+    with st.expander("🛠️ Debug: Rerun Timings"):
+        st.markdown(f"Rerun took **{timing_record['total_ms']:,.1f} ms** (steps overlap: sections include their figures).")
+        rows = sorted(timing_record["timings"].items(), key=lambda item: item[1]["ms"], reverse=True)
+        st.markdown("| Step | Calls | ms |\n|---|---:|---:|\n" + "\n".join(
+            f"| {name} | {timing['calls']} | {timing['ms']:,.2f} |" for name, timing in rows))
+        st.download_button("Download timings (JSON)", json.dumps(timing_record, indent=2), file_name="rerun_timings.json",
+                           mime="application/json")
+        if profiler.cprofile_error:
+            st.warning(f"cProfile capture skipped: {profiler.cprofile_error}")
+        cprofile_stats = profiler.stats()
+        if cprofile_stats:
+            st.code(cprofile_stats, language=None)
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""Benchmark the HTTP API under concurrent clients.
+
+Starts ``python -m financial_health serve`` on a free local port and reports
+latency and throughput for single profiles (all distinct, then repeated so
+they hit the response cache), a large batch and Monte Carlo simulations,
+plus ``/health`` latency while simulations keep the worker pool busy, which
+shows whether the event loop stays responsive. Run from the
+``Financial app`` directory:
+
+    python benchmarks/bench_api.py --clients 16
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import REPRESENTATIVE_PROFILE  # noqa: E402
+
+SIMULATION = {"retirement_savings": 40000, "annual_contribution": 6000, "years_to_retirement": 35,
+              "mean_return": 0.07, "volatility": 0.15, "n_paths": 100_000}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request(url, body=None):
+    data = None if body is None else json.dumps(body).encode()
+    start = time.perf_counter()
+    with urllib.request.urlopen(urllib.request.Request(url, data, {"Content-Type": "application/json"})) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def profiles(count, seed):
+    rng = random.Random(seed)
+    return [dict(REPRESENTATIVE_PROFILE, monthly_salary=rng.randint(2000, 12000), housing=rng.randint(500, 3000))
+            for _ in range(count)]
+
+
+def run(label, url, bodies, clients):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        latencies = np.array(list(pool.map(lambda body: request(url, body), bodies)))
+    elapsed = time.perf_counter() - start
+    p50, p95, p99 = np.percentile(latencies * 1000, [50, 95, 99])
+    print(f"{label:<34} {len(bodies):>6} {len(bodies) / elapsed:>9.1f} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the financial health HTTP API")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent client threads")
+    parser.add_argument("--requests", type=int, default=2000, help="single-profile requests per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="server worker processes")
+    args = parser.parse_args()
+
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen([sys.executable, "-m", "financial_health", "serve", "--port", str(port), "--workers", str(args.workers)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(100):
+            try:
+                request(base + "/health")
+                break
+            except OSError:
+                time.sleep(0.1)
+
+        print(f"{'endpoint':<34} {'reqs':>6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        distinct = profiles(args.requests, seed=0)
+        run("/score (distinct profiles)", base + "/score", distinct, args.clients)
+        run("/score (cached)", base + "/score", distinct, args.clients)
+        run("/score/batch (10,000 profiles)", base + "/score/batch", [{"profiles": profiles(10_000, seed=1)}], 1)
+        simulations = [dict(SIMULATION, seed=seed) for seed in range(4 * args.workers)]
+
+        # /health latency while the simulations run
+        health = []
+        busy = threading.Thread(target=run, args=("/simulate/retirement (100k paths)", base + "/simulate/retirement",
+                                                  simulations, args.clients))
+        busy.start()
+        while busy.is_alive():
+            health.append(request(base + "/health"))
+        busy.join()
+        p50, p99 = np.percentile(np.array(health) * 1000, [50, 99])
+        print(f"{'/health during simulations':<34} {len(health):>6} {'':>9} {p50:>9.2f} {'':>9} {p99:>9.2f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measure the payload each chart backend sends to the browser.
+
+For the cash-flow, 50/30/20 and goal forecast charts, reports the size of
+what each backend ships per rerun (Plotly figure JSON, Vega-Lite spec JSON or
+SVG document), raw and gzip-compressed, and the time to build it. Run from
+the ``Financial app`` directory:
+
+    python benchmarks/bench_chart_payload.py
+
+Plotly charts additionally need the Plotly.js bundle (several MB, fetched
+once per browser session); Vega-Lite is part of Streamlit's own frontend and
+SVG needs no charting code at all.
+"""
+
+import gzip
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from financial_health import charts, lite_charts, score_profile  # noqa: E402
+from financial_health.forecast import goal_forecast, goal_projection  # noqa: E402
+from bench_suite import EXTREME_PROFILE, REPRESENTATIVE_PROFILE  # noqa: E402
+
+BACKENDS = {
+    "plotly": (lambda builder, *args: builder(*args).to_json(), charts, "_figure"),
+    "vega": (lambda builder, *args: json.dumps(builder(*args)), lite_charts, "_spec"),
+    "svg": (lambda builder, *args: builder(*args), lite_charts, "_svg"),
+}
+
+
+def chart_inputs(profile, goal_amount):
+    m = score_profile(profile)
+    years_to_goal = goal_forecast(m["monthly_savings"], goal_amount, 5)["years_to_goal"].item()
+    years, projected_savings, _ = goal_projection(m["monthly_savings"], goal_amount, years_to_goal, 0.0, "monthly")
+    return {
+        "cash_flow": (m["total_monthly_income"], m["total_monthly_expenses"], m["total_debt_payment"], m["monthly_savings"]),
+        "budget_comparison": (m["needs"], m["wants"], m["savings_debt"]),
+        "goal_forecast": (years, projected_savings, goal_amount, "Save for House"),
+    }
+
+
+def main():
+    charts.cash_flow_figure(1, 1, 1, 1)  # load plotly outside the timed region
+    print(f"{'chart':<36} {'backend':<8} {'bytes':>9} {'gzip':>8} {'build ms':>9}")
+    for label, profile, goal_amount in [("representative", REPRESENTATIVE_PROFILE, 30_000), ("extreme", EXTREME_PROFILE, 1_000_000)]:
+        totals = {backend: [0, 0] for backend in BACKENDS}
+        for chart, args in chart_inputs(profile, goal_amount).items():
+            for backend, (serialize, module, suffix) in BACKENDS.items():
+                builder = getattr(module, chart + suffix)
+                payload = serialize(builder, *args).encode()
+                compressed = len(gzip.compress(payload))
+                seconds = min(timeit.repeat(lambda: serialize(builder, *args), number=20, repeat=3)) / 20
+                totals[backend][0] += len(payload)
+                totals[backend][1] += compressed
+                print(f"{chart + ' (' + label + ')':<36} {backend:<8} {len(payload):>9,} {compressed:>8,} {seconds * 1000:>9.2f}")
+        for backend, (raw, compressed) in totals.items():
+            print(f"{'total (' + label + ')':<36} {backend:<8} {raw:>9,} {compressed:>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Import-time benchmark based on ``python -X importtime``.
+
+Run from the ``Financial app`` directory:
+
+    python benchmarks/bench_import_time.py [--budget-ms 250]
+
+Imports the modules app.py loads at startup (read from its top-level import
+statements, Streamlit itself excluded) in a fresh interpreter, prints the
+slowest imports, and exits with a non-zero status if the total exceeds the
+budget or if a heavy module that should only be loaded lazily (pandas,
+plotly, matplotlib) shows up.
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def startup_imports(path=os.path.join(APP_DIR, "app.py")):
+    """Modules imported at the top level of app.py, minus Streamlit.
+
+    Imports inside functions are lazy and left out. ``from package import
+    name`` counts ``package.name`` too when ``name`` is a submodule in the
+    app directory.
+    """
+
+    def is_submodule(name):
+        path = os.path.join(APP_DIR, *name.split("."))
+        return os.path.isfile(path + ".py") or os.path.isfile(os.path.join(path, "__init__.py"))
+
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names
+                                     if is_submodule(f"{node.module}.{alias.name}")]
+        else:
+            continue
+        modules += [name for name in names if name.split(".")[0] != "streamlit" and name not in modules]
+    return modules
+
+
+# What app.py imports before the first widget is drawn
+STARTUP_IMPORTS = startup_imports()
+LAZY_MODULES = ["pandas", "plotly", "matplotlib"]
+
+
+def _importtime_lines(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    return [line for line in result.stderr.splitlines() if line.startswith("import time:") and "self [us]" not in line]
+
+
+def import_times(modules):
+    """Run ``python -X importtime`` and return {module: (self_us, cumulative_us, nested)}.
+
+    ``nested`` is true for modules imported by another module, shown indented
+    under it in the name column. Modules the interpreter itself loads before
+    running any code (``site``, ``encodings``, ...) are left out.
+    """
+    interpreter = {line.split("|")[-1].strip() for line in _importtime_lines("pass")}
+    times = {}
+    for line in _importtime_lines("import " + ", ".join(modules)):
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if name.strip() in interpreter:
+            continue
+        times[name.strip()] = (int(self_us), int(cumulative_us), name.startswith("  "))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=250, help="maximum total import time in milliseconds")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to show")
+    args = parser.parse_args(argv)
+
+    times = import_times(STARTUP_IMPORTS)
+    # Only top-level entries (no indentation in the name column) add up to the
+    # total; a nested one is already in its parent's cumulative time
+    total_ms = sum(cumulative_us for _, cumulative_us, nested in times.values() if not nested) / 1000
+
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for name, (self_us, cumulative_us, _) in sorted(times.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>8.1f}  {name}")
+    print(f"\nTotal startup import time: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    eager = [module for module in LAZY_MODULES if module in times]
+    if eager:
+        print(f"FAIL: imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print("FAIL: startup imports are over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
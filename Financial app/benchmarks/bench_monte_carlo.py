@@ -0,0 +1,47 @@
+"""Benchmark the Monte Carlo retirement simulator.
+
+Run from the ``Financial app`` directory:
+
+    python benchmarks/bench_monte_carlo.py
+
+Exits with a non-zero status if 100k paths over the longest horizon the app
+allows (age 18 to 75) take a second or more.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from financial_health import simulate_retirement  # noqa: E402
+
+BUDGET_SECONDS = 1.0
+MAX_HORIZON = 75 - 18
+
+
+def time_simulation(n_paths, years, repeat=5):
+    """Best-of-``repeat`` wall time in seconds for one simulation."""
+    return min(timeit.repeat(
+        lambda: simulate_retirement(40000, 14400, years, 0.07, 0.15, n_paths=n_paths, target_balance=1_500_000),
+        number=1,
+        repeat=repeat,
+    ))
+
+
+def main():
+    print(f"{'paths':>8} {'years':>6} {'seconds':>9}")
+    for n_paths in (10_000, 50_000, 100_000):
+        for years in (35, MAX_HORIZON):
+            print(f"{n_paths:>8} {years:>6} {time_simulation(n_paths, years):>9.3f}")
+
+    worst = time_simulation(100_000, MAX_HORIZON)
+    if worst >= BUDGET_SECONDS:
+        print(f"FAIL: 100k paths x {MAX_HORIZON} years took {worst:.3f}s (budget {BUDGET_SECONDS}s)")
+        return 1
+    print(f"OK: 100k paths x {MAX_HORIZON} years in {worst:.3f}s (budget {BUDGET_SECONDS}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
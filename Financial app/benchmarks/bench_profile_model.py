@@ -0,0 +1,68 @@
+"""Benchmark the profile representations: dicts, ``Profile`` objects and a structured array.
+
+Reports the memory held by 100,000 profiles in each form, the time to key a
+profile for a cache, and batch scoring from the structured array against a
+DataFrame. Run from the ``Financial app`` directory:
+
+    python benchmarks/bench_profile_model.py
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import REPRESENTATIVE_PROFILE  # noqa: E402
+from financial_health import Profile, score_arrays, score_households, to_records  # noqa: E402
+
+N_PROFILES = 100_000
+
+
+def best_of(func, number=1, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def allocated(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    rng = np.random.default_rng(0)
+    salaries = rng.integers(2000, 12000, N_PROFILES).tolist()
+    dicts, dict_bytes = allocated(lambda: [dict(REPRESENTATIVE_PROFILE, monthly_salary=s) for s in salaries])
+    profiles, profile_bytes = allocated(lambda: [Profile.from_mapping(d) for d in dicts])
+    records, record_bytes = allocated(lambda: to_records(profiles))
+
+    print(f"memory for {N_PROFILES:,} profiles")
+    for label, size in (("dicts", dict_bytes), ("Profile objects", profile_bytes), ("structured array", record_bytes)):
+        print(f"  {label:<18} {size / 1e6:>8.1f} MB {size / N_PROFILES:>7.0f} B/profile")
+
+    profile = profiles[0]
+    print("cache key for one profile")
+    for label, func in (
+        ("json + sha256 (dict)", lambda: hashlib.sha256(json.dumps(dicts[0], sort_keys=True).encode()).hexdigest()),
+        ("pickle (Profile)", lambda: pickle.dumps(profile)),
+        ("Profile.key()", profile.key),
+    ):
+        print(f"  {label:<22} {best_of(func, number=10_000) * 1e6:>7.2f} us")
+
+    df = pd.DataFrame(dicts)
+    print(f"scoring {N_PROFILES:,} profiles")
+    print(f"  {'score_households(df)':<22} {best_of(lambda: score_households(df)):>7.3f} s")
+    print(f"  {'score_arrays(records)':<22} {best_of(lambda: score_arrays(records)):>7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the profile store: bulk and concurrent writes, progress queries.
+
+Run from the ``Financial app`` directory:
+
+    python benchmarks/bench_profile_store.py
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import threading
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from financial_health import score_profile  # noqa: E402
+from financial_health.store import ProfileStore  # noqa: E402
+from bench_suite import REPRESENTATIVE_PROFILE  # noqa: E402
+
+USERS = 1_000
+YEARS = 10
+SESSIONS = 50
+SAVES_PER_SESSION = 200
+
+
+def best_of(func, repeat=5, number=20):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def monthly_history(metrics):
+    start = datetime.date(2015, 1, 1)
+    for user in range(USERS):
+        for month in range(YEARS * 12):
+            snapshot_date = datetime.date(start.year + month // 12, month % 12 + 1, 1)
+            yield f"user{user}", snapshot_date, REPRESENTATIVE_PROFILE, metrics["net_worth"] + month * 500, metrics["financial_health_score"]
+
+
+def main():
+    metrics = score_profile(REPRESENTATIVE_PROFILE)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ProfileStore(os.path.join(directory, "bench.db"))
+
+        rows = USERS * YEARS * 12
+        seconds = min(timeit.repeat(lambda: store.save_snapshots(monthly_history(metrics)), number=1, repeat=1))
+        print(f"bulk write: {rows:,} monthly snapshots in {seconds:.2f}s ({rows / seconds:,.0f} rows/s)")
+
+        def session(index):
+            for day in range(SAVES_PER_SESSION):
+                store.save_snapshot(f"session{index}", REPRESENTATIVE_PROFILE, metrics,
+                                    datetime.date(2024, 1, 1) + datetime.timedelta(days=day))
+
+        threads = [threading.Thread(target=session, args=(index,)) for index in range(SESSIONS)]
+        start = timeit.default_timer()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.flush()
+        seconds = timeit.default_timer() - start
+        saves = SESSIONS * SAVES_PER_SESSION
+        print(f"concurrent saves: {saves:,} from {SESSIONS} sessions in {seconds:.2f}s ({saves / seconds:,.0f} saves/s)")
+
+        seconds = best_of(lambda: store.progress("user500"))
+        print(f"progress query ({YEARS} years of monthly snapshots): {seconds * 1000:.2f} ms")
+        seconds = best_of(lambda: store.latest_profile("user500"))
+        print(f"latest profile lookup: {seconds * 1000:.3f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
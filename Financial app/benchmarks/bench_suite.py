@@ -0,0 +1,290 @@
+"""Benchmark suite for the work done on every dashboard rerun.
+
+Benchmarks are written asv-style: each class may define ``params`` and a
+``setup`` method, and every ``time_*`` method is one benchmark. The built-in
+runner needs nothing beyond the app's own dependencies. Run from the
+``Financial app`` directory:
+
+    python benchmarks/bench_suite.py [--filter figure] [--repeat 5]
+
+For every benchmark it reports the best and median latency and the
+single-core throughput (calls per second), so results can be tracked over
+time and compared between machines with different core counts.
+"""
+
+import argparse
+import inspect
+import os
+import statistics
+import sys
+import timeit
+from functools import partial
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from financial_health import INPUT_COLUMNS, charts, get_health_status, score_households, score_profile  # noqa: E402
+from financial_health.cli import score_frame  # noqa: E402
+from financial_health.forecast import goal_forecast, goal_projection, project_retirement, sensitivity_sweep  # noqa: E402
+from financial_health.planner import plan_goals  # noqa: E402
+from financial_health.projection import net_worth_milestones, project_net_worth  # noqa: E402
+from financial_health.recommendations import budget_recommendations, health_recommendations  # noqa: E402
+
+# The dashboard's default sidebar values
+REPRESENTATIVE_PROFILE = {
+    "monthly_salary": 4000, "side_income": 500, "other_income": 0,
+    "housing": 1200, "utilities": 200, "groceries": 400, "transportation": 300,
+    "healthcare": 100, "entertainment": 200, "other_expenses": 200,
+    "student_loan": 15000, "car_loan": 10000, "credit_card": 2000, "mortgage": 200000, "other_debt": 0,
+    "student_loan_payment": 200, "car_loan_payment": 300, "credit_card_payment": 200,
+    "mortgage_payment": 900, "other_debt_payment": 0,
+    "emergency_fund": 10000, "investments": 50000, "retirement": 40000, "property_value": 250000, "other_assets": 5000,
+}
+
+# Saves $1/month towards a $1M goal, i.e. ~83,000 years to goal
+EXTREME_PROFILE = dict(REPRESENTATIVE_PROFILE, other_expenses=REPRESENTATIVE_PROFILE["other_expenses"] + 299)
+
+
+def random_profiles(n, seed=0):
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({column: rng.integers(0, 10_000, n) for column in INPUT_COLUMNS})
+
+
+class Scoring:
+    params = [1, 1_000, 100_000]
+    param_names = ["profiles"]
+
+    def setup(self, profiles):
+        self.df = random_profiles(profiles)
+
+    def time_score_households(self, profiles):
+        score_households(self.df)
+
+    def time_score_frame(self, profiles):
+        # Batch scoring with forecasts and joined recommendation text
+        score_frame(self.df)
+
+
+class SingleProfile:
+    def setup(self):
+        self.metrics = score_profile(REPRESENTATIVE_PROFILE)
+        self.expense_values = [1200, 200, 400, 300, 100, 200, 200, 1600]
+
+    def time_score_profile(self):
+        score_profile(REPRESENTATIVE_PROFILE)
+
+    def time_get_health_status(self):
+        get_health_status(self.metrics["savings_rate"], [0, 10, 20], ["danger", "warning", "good"])
+
+    def time_health_recommendations(self):
+        m = self.metrics
+        health_recommendations(m["savings_rate"], m["debt_to_income"], m["emergency_months"], m["housing_to_income"], 2000)
+
+    def time_budget_recommendations(self):
+        m = self.metrics
+        budget_recommendations(m["needs"], m["wants"], m["savings_debt"], self.expense_values)
+
+
+class Forecast:
+    # (monthly savings, goal amount, years to retirement)
+    params = [(300, 30_000, 35), (1, 1_000_000, 57)]
+    param_names = ["savings_goal_horizon"]
+
+    def time_goal_forecast(self, case):
+        monthly_savings, goal_amount, _ = case
+        goal_forecast(monthly_savings, goal_amount, 30)
+
+    def time_goal_projection(self, case):
+        monthly_savings, goal_amount, _ = case
+        years_to_goal = goal_forecast(monthly_savings, goal_amount, 30, 0.05)["years_to_goal"].item()
+        goal_projection(monthly_savings, goal_amount, years_to_goal, 0.05, "monthly")
+
+    def time_project_retirement(self, case):
+        monthly_savings, _, years = case
+        project_retirement(40000, monthly_savings, 4500, years, 0.07)
+
+
+class GoalPlanner:
+    """Savings split across goals with mixed priorities and deadlines of 6 months to 20 years."""
+
+    params = [2, 12, 48]
+    param_names = ["goals"]
+
+    def setup(self, goals):
+        rng = np.random.default_rng(0)
+        self.goals = (rng.integers(1_000, 50_000, goals), rng.integers(6, 240, goals), rng.integers(1, 4, goals))
+
+    def time_plan_goals(self, goals):
+        plan_goals(3000, *self.goals, annual_return=0.04)
+
+
+class NetWorthTrajectory:
+    """Full 50-year monthly net worth projections (601 months per profile)."""
+
+    params = [1, 1_000]
+    param_names = ["profiles"]
+
+    def setup(self, profiles):
+        df = random_profiles(profiles)
+        self.data = {column: df[column].to_numpy(dtype=float) for column in INPUT_COLUMNS}
+
+    def time_project_net_worth(self, profiles):
+        project_net_worth(self.data)
+
+
+class NetWorthMilestones:
+    """Net worth after 10, 30 and 50 years only, as in batch scoring."""
+
+    params = [1_000, 100_000]
+    param_names = ["profiles"]
+
+    def setup(self, profiles):
+        df = random_profiles(profiles)
+        self.data = {column: df[column].to_numpy(dtype=float) for column in INPUT_COLUMNS}
+
+    def time_net_worth_milestones(self, profiles):
+        net_worth_milestones(self.data)
+
+
+class SensitivitySweep:
+    """The dashboard's what-if sweep grid (21 x 12 x 26 x 53 = 347,256 combinations)."""
+
+    def setup(self):
+        self.grids = (np.arange(0, 1001, 50), np.arange(1, 13) / 100, np.arange(50, 76), np.arange(18, 71))
+
+    def time_sensitivity_sweep(self):
+        sensitivity_sweep(40000, 300, 4500, *self.grids)
+
+
+class Figures:
+    params = ["representative", "extreme"]
+    param_names = ["profile"]
+
+    def setup(self, profile):
+        profile = REPRESENTATIVE_PROFILE if profile == "representative" else EXTREME_PROFILE
+        self.m = score_profile(profile)
+        self.goal_amount = 30_000 if profile is REPRESENTATIVE_PROFILE else 1_000_000
+        self.years_to_goal = goal_forecast(self.m["monthly_savings"], self.goal_amount, 30)["years_to_goal"].item()
+        self.expense_values = [profile[c] for c in ["housing", "utilities", "groceries", "transportation", "healthcare",
+                                                    "entertainment", "other_expenses"]] + [self.m["total_debt_payment"]]
+        charts.cash_flow_figure(1, 1, 1, 1)  # load plotly outside the timed region
+
+    def time_cash_flow_figure(self, profile):
+        m = self.m
+        charts.cash_flow_figure(m["total_monthly_income"], m["total_monthly_expenses"], m["total_debt_payment"], m["monthly_savings"]).to_json()
+
+    def time_health_gauge_figure(self, profile):
+        charts.health_gauge_figure(self.m["financial_health_score"]).to_json()
+
+    def time_expense_pie_figure(self, profile):
+        charts.expense_pie_figure(["Housing", "Utilities", "Groceries", "Transportation", "Healthcare", "Entertainment",
+                                   "Other Expenses", "Debt Payments"], self.expense_values).to_json()
+
+    def time_budget_comparison_figure(self, profile):
+        charts.budget_comparison_figure(self.m["needs"], self.m["wants"], self.m["savings_debt"]).to_json()
+
+    def time_goal_forecast_figure(self, profile):
+        years, projected_savings, _ = goal_projection(self.m["monthly_savings"], self.goal_amount, self.years_to_goal)
+        charts.goal_forecast_figure(years, projected_savings, self.goal_amount, "Save for House").to_json()
+
+
+class FigureCache:
+    """A cached figure on a rerun that hits the cache, against rebuilding it.
+
+    ``cache_data`` pickles the figure and unpickles a copy on every hit;
+    ``cache_resource`` (what the app uses for figures) returns the stored one.
+    """
+
+    params = ["cash_flow", "health_gauge"]
+    param_names = ["figure"]
+
+    def setup(self, figure):
+        import streamlit as st
+        from streamlit.logger import set_log_level
+
+        # Outside `streamlit run` the caches work but warn on every call
+        set_log_level("error")
+        m = score_profile(REPRESENTATIVE_PROFILE)
+        if figure == "cash_flow":
+            self.build = charts.cash_flow_figure
+            self.args = (m["total_monthly_income"], m["total_monthly_expenses"], m["total_debt_payment"], m["monthly_savings"])
+        else:
+            self.build = charts.health_gauge_figure
+            self.args = (m["financial_health_score"],)
+        self.data_cached = st.cache_data(show_spinner=False)(self.build)
+        self.resource_cached = st.cache_resource(show_spinner=False)(self.build)
+        self.data_cached(*self.args)
+        self.resource_cached(*self.args)
+
+    def time_rebuild(self, figure):
+        self.build(*self.args)
+
+    def time_cache_data_hit(self, figure):
+        self.data_cached(*self.args)
+
+    def time_cache_resource_hit(self, figure):
+        self.resource_cached(*self.args)
+
+
+class Rerun:
+    """Everything an uncached rerun computes and serializes for one profile."""
+
+    params = ["representative", "extreme"]
+    param_names = ["profile"]
+
+    def setup(self, profile):
+        self.figures = Figures()
+        self.figures.setup(profile)
+        self.profile = REPRESENTATIVE_PROFILE if profile == "representative" else EXTREME_PROFILE
+
+    def time_full_rerun(self, profile):
+        m = score_profile(self.profile)
+        health_recommendations(m["savings_rate"], m["debt_to_income"], m["emergency_months"], m["housing_to_income"], 2000)
+        budget_recommendations(m["needs"], m["wants"], m["savings_debt"], self.figures.expense_values)
+        goal_forecast(m["monthly_savings"], self.figures.goal_amount, 5)
+        project_retirement(40000, m["monthly_savings"], m["total_monthly_income"], 35, 0.07)
+        for method in dir(self.figures):
+            if method.startswith("time_"):
+                getattr(self.figures, method)(profile)
+
+
+def iter_benchmarks(name_filter=None):
+    """Yield (name, setup, func) for every benchmark/parameter combination in this module."""
+    for class_name, cls in inspect.getmembers(sys.modules[__name__], inspect.isclass):
+        if cls.__module__ != __name__:
+            continue
+        methods = [name for name in dir(cls) if name.startswith("time_")]
+        params = getattr(cls, "params", None)
+        for param in (params if params is not None else [None]):
+            args = () if params is None else (param,)
+            for method in methods:
+                name = f"{class_name}.{method}" + (f"({param})" if params is not None else "")
+                if name_filter and name_filter not in name:
+                    continue
+                instance = cls()
+                setup = getattr(instance, "setup", None)
+                yield name, partial(setup, *args) if setup else (lambda: None), partial(getattr(instance, method), *args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the dashboard benchmark suite")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per benchmark")
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':<60} {'best ms':>10} {'median ms':>10} {'calls/s/core':>13}")
+    for name, setup, func in iter_benchmarks(args.filter):
+        setup()
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        runs = [seconds / number for seconds in timer.repeat(repeat=args.repeat, number=number)]
+        best, median = min(runs), statistics.median(runs)
+        print(f"{name:<60} {best * 1000:>10.3f} {median * 1000:>10.3f} {1 / best:>13,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Load test: many simulated dashboard sessions sharing one app process.
+
+Each session drives ``app.py`` headlessly with Streamlit's ``AppTest`` and
+performs random interactions (editing a sidebar input, moving a slider or
+switching section), each followed by a rerun. Sessions share the
+process-wide caches, as they do on a real server. Run from the
+``Financial app`` directory:
+
+    python benchmarks/load_test.py --sessions 20 --reruns 30 --think-time 2
+
+``AppTest`` can't run scripts from several threads at once, so the sessions
+are served one rerun at a time, like a server bound to one core by the GIL:
+each session waits ``--think-time`` seconds on average (exponentially
+distributed) between interactions, and a rerun that arrives while another is
+running queues behind it. Reported latency is measured from the interaction
+to the end of its rerun, so it includes that queueing; service time is the
+rerun alone. Increase ``--sessions`` until p95/p99 latency degrades to find
+how many concurrent users one process sustains.
+
+Also reports resident memory per open session. Use ``--tabs`` to render
+every section on each rerun instead of only the selected one, and ``--json``
+to save the numbers for comparison between changes.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+PERCENTILES = [50, 95, 99]
+
+
+def rss_mb():
+    """Resident memory of this process in MB (peak memory where /proc isn't available)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def random_interaction(at, rng):
+    """Change one widget the way a user would; the caller reruns the app."""
+    choices = []
+    if len(at.sidebar.number_input):
+        choices += ["number_input"] * 3
+    if len(at.slider):
+        choices.append("slider")
+    if "section" in [radio.key for radio in at.radio]:
+        choices.append("section")
+    if not choices:
+        return
+    choice = rng.choice(choices)
+
+    if choice == "section":
+        section = at.radio(key="section")
+        section.set_value(rng.choice(section.options))
+    elif choice == "slider":
+        slider = rng.choice(list(at.slider))
+        steps = int((slider.max - slider.min) / slider.step)
+        slider.set_value(type(slider.value)(slider.min + rng.randint(0, steps) * slider.step))
+    else:
+        number_input = rng.choice(list(at.sidebar.number_input))
+        value = number_input.value * rng.uniform(0.5, 1.5) if number_input.value else rng.uniform(0, 1000)
+        if number_input.max is not None:
+            value = min(value, number_input.max)
+        number_input.set_value(type(number_input.value)(round(value / number_input.step) * number_input.step))
+
+
+def load_test(sessions, reruns, think_time=2.0, seed=0, timeout=60):
+    """Serve ``reruns`` random interactions for each of ``sessions`` sessions; returns a summary dict."""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    rng = random.Random(seed)
+    baseline = rss_mb()
+
+    # Every session opens the app (cold caches for the first one)
+    apps, first_runs = [], []
+    for _ in range(sessions):
+        at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        start = time.perf_counter()
+        at.run()
+        first_runs.append(time.perf_counter() - start)
+        apps.append(at)
+    memory = rss_mb()
+
+    # Then interacts: (arrival time, session, interactions left), served in arrival order
+    clock = time.perf_counter()
+    arrivals = [(clock + rng.expovariate(1 / think_time), index, reruns) for index in range(sessions)] if think_time > 0 \
+        else [(clock, index, reruns) for index in range(sessions)]
+    heapq.heapify(arrivals)
+    latencies, service_times, errors = [], [], set()
+    start_all = time.perf_counter()
+
+    while arrivals:
+        arrival, index, remaining = heapq.heappop(arrivals)
+        wait = arrival - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+
+        at = apps[index]
+        random_interaction(at, rng)
+        start = time.perf_counter()
+        at.run()
+        end = time.perf_counter()
+        service_times.append(end - start)
+        latencies.append(end - arrival)
+        errors.update(str(exception.value) for exception in at.exception)
+
+        if remaining > 1:
+            next_arrival = end + (rng.expovariate(1 / think_time) if think_time > 0 else 0)
+            heapq.heappush(arrivals, (next_arrival, index, remaining - 1))
+
+    elapsed = time.perf_counter() - start_all
+    latencies, service_times, first_runs = (np.array(values) * 1000 for values in (latencies, service_times, first_runs))
+    return {
+        "sessions": sessions,
+        "reruns": int(latencies.size),
+        "think_time_s": think_time,
+        "elapsed_s": elapsed,
+        "reruns_per_s": latencies.size / elapsed,
+        "utilization": float(service_times.sum() / 1000 / elapsed),
+        "latency_ms": {f"p{p}": float(np.percentile(latencies, p)) for p in PERCENTILES},
+        "service_ms": {f"p{p}": float(np.percentile(service_times, p)) for p in PERCENTILES},
+        "first_run_ms": {f"p{p}": float(np.percentile(first_runs, p)) for p in PERCENTILES},
+        "rss_baseline_mb": baseline,
+        "rss_mb": memory,
+        "mb_per_session": (memory - baseline) / sessions,
+        "errors": sorted(errors),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard sessions")
+    parser.add_argument("--sessions", type=int, default=10, help="simulated sessions")
+    parser.add_argument("--reruns", type=int, default=20, help="interactions (reruns) per session")
+    parser.add_argument("--think-time", type=float, default=2.0, help="mean seconds between a session's interactions (0: back to back)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random interactions")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument("--tabs", action="store_true", help="render all sections as tabs (FINANCIAL_HEALTH_LAZY_SECTIONS=0)")
+    parser.add_argument("--json", help="also write the summary to this file")
+    args = parser.parse_args(argv)
+
+    if args.tabs:
+        os.environ["FINANCIAL_HEALTH_LAZY_SECTIONS"] = "0"
+    summary = load_test(args.sessions, args.reruns, args.think_time, args.seed, args.timeout)
+
+    print(f"{summary['sessions']} sessions, {summary['reruns']:,} reruns in {summary['elapsed_s']:.1f}s "
+          f"({summary['reruns_per_s']:.1f} reruns/s, {summary['utilization']:.0%} busy)")
+    for label, key in [("rerun latency", "latency_ms"), ("service time", "service_ms"), ("first run", "first_run_ms")]:
+        print(f"{label + ' ms:':<20}" + "  ".join(f"{name} {value:8.1f}" for name, value in summary[key].items()))
+    print(f"memory: {summary['rss_baseline_mb']:.0f} MB -> {summary['rss_mb']:.0f} MB "
+          f"({summary['mb_per_session']:.1f} MB per session)")
+    for error in summary["errors"]:
+        print(f"error: {error}")
+
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump(summary, out, indent=2)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""Calculation engine behind the Financial Health Dashboard."""
+
+from .debt import PayoffResult, minimum_extra_payment, payoff_order, simulate_payoff
+from .planner import GoalPlan, plan_goals
+from .profile import PROFILE_DTYPE, Profile, ProfileTotals, from_records, to_records
+from .projection import NetWorthProjection, net_worth_milestones, project_net_worth
+from .retirement import SimulationResult, simulate_retirement
+from .rules import DEFAULT_RULE_SET, RuleSet, get_health_status, load_rules
+from .scoring import INPUT_COLUMNS, score_arrays, score_households, score_profile
+
+__all__ = [
+    "DEFAULT_RULE_SET",
+    "GoalPlan",
+    "INPUT_COLUMNS",
+    "NetWorthProjection",
+    "PROFILE_DTYPE",
+    "PayoffResult",
+    "Profile",
+    "ProfileTotals",
+    "RuleSet",
+    "SimulationResult",
+    "from_records",
+    "get_health_status",
+    "load_rules",
+    "minimum_extra_payment",
+    "net_worth_milestones",
+    "payoff_order",
+    "plan_goals",
+    "project_net_worth",
+    "score_arrays",
+    "score_households",
+    "score_profile",
+    "simulate_payoff",
+    "simulate_retirement",
+    "to_records",
+]
@@ -0,0 +1,361 @@
+"""Async HTTP API serving the dashboard's scores, forecasts and simulations.
+
+    python -m financial_health serve --port 8000
+
+Endpoints take and return JSON:
+
+    GET  /health               liveness check and cache statistics
+    POST /score                one profile
+    POST /score/batch          {"profiles": [profile, ...]}
+    POST /simulate/retirement  Monte Carlo retirement simulation
+
+A profile uses the sidebar input names (``INPUT_COLUMNS``; missing ones
+count as 0) plus, optionally, the forecast inputs in ``FORECAST_DEFAULTS``,
+and is scored exactly like a row of ``python -m financial_health score``:
+ratios, score, statuses, recommendations, the goal and retirement
+forecasts and the net worth milestones. Non-finite results, such as the
+years to a goal nothing is being saved towards, are returned as null.
+
+Responses are cached by endpoint and request body, up to a total size, and
+identical requests arriving together share one computation. Request bodies
+over ``MAX_BODY_BYTES`` are refused before they are parsed. Nothing is calculated on the event
+loop: single profiles and small batches are scored in a thread, large
+batches and simulations in a process pool.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from numbers import Integral, Real
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from .cli import FORECAST_DEFAULTS, score_columns
+from .retirement import DEFAULT_PERCENTILES, simulate_retirement
+from .rules import DEFAULT_RULE_SET
+from .scoring import INPUT_COLUMNS
+
+PROFILE_FIELDS = INPUT_COLUMNS + list(FORECAST_DEFAULTS)
+PROFILE_DEFAULTS = {**{column: 0 for column in INPUT_COLUMNS}, **FORECAST_DEFAULTS}
+
+CACHE_MAX_ENTRIES = 1024
+CACHE_MAX_BYTES = 256 * 2 ** 20  # one full batch response can be hundreds of MB on its own
+CACHE_TTL_SECONDS = 3600
+MAX_BODY_BYTES = 128 * 2 ** 20  # room for a full batch of profiles with every field
+MAX_BATCH_PROFILES = 100_000
+# Batches of at least this many profiles are worth the trip to the process pool
+PROCESS_POOL_MIN_PROFILES = 2_000
+MAX_SIMULATION_PATHS = 200_000
+MAX_SIMULATION_YEARS = 100
+MAX_AMOUNT = 1e12  # dollars: far beyond any household, and sums of them stay exact enough
+MAX_AGE = 120
+
+PROFILE_RANGES = {
+    # name: (low, high, low is excluded)
+    **{column: (0, MAX_AMOUNT, False) for column in INPUT_COLUMNS},
+    "goal_amount": (0, MAX_AMOUNT, False),
+    "goal_timeline_years": (0, MAX_SIMULATION_YEARS, True),
+    "current_age": (0, MAX_AGE, False),
+    "retirement_age": (0, MAX_AGE, False),
+    "expected_annual_return": (-1, 1, True),
+}
+
+SIMULATION_FIELDS = {
+    # name: (required, default)
+    "retirement_savings": (True, None),
+    "annual_contribution": (True, None),
+    "years_to_retirement": (True, None),
+    "mean_return": (True, None),
+    "volatility": (True, None),
+    "n_paths": (False, 10_000),
+    "target_balance": (False, 0.0),
+    "seed": (False, 0),  # fixed by default, so cached and fresh responses agree
+}
+
+
+class RequestError(ValueError):
+    """A request the API can't process; reported as HTTP 400."""
+
+    status_code = 400
+
+
+class BodyTooLarge(RequestError):
+    """A request body over the size limit; reported as HTTP 413."""
+
+    status_code = 413
+
+
+def _number(value, name):
+    try:
+        finite = not isinstance(value, bool) and isinstance(value, Real) and math.isfinite(value)
+    except OverflowError:
+        # JSON integers too large for a float
+        finite = False
+    if not finite:
+        raise RequestError(f"{name} must be a finite number")
+    return value
+
+
+def _bounded(value, name, low, high, low_excluded=False):
+    value = _number(value, name)
+    if not (low < value if low_excluded else low <= value) or value > high:
+        raise RequestError(f"{name} must be {'over' if low_excluded else 'from'} {low:,g} {'and at most' if low_excluded else 'to'} {high:,g}")
+    return value
+
+
+def _integer(value, name, low, high):
+    if isinstance(value, bool) or not isinstance(value, Integral) or not low <= value <= high:
+        raise RequestError(f"{name} must be an integer from {low:,} to {high:,}")
+    return int(value)
+
+
+def parse_profile(body, name="profile"):
+    """Validated profile dict from a request body."""
+    if not isinstance(body, dict):
+        raise RequestError(f"{name} must be a JSON object")
+    unknown = sorted(set(body) - set(PROFILE_FIELDS))
+    if unknown:
+        raise RequestError(f"{name} has unknown fields: {', '.join(unknown)}")
+    return {field: _bounded(value, f"{name}.{field}", *PROFILE_RANGES[field]) for field, value in body.items()}
+
+
+def parse_batch(body):
+    """Validated list of profile dicts from a ``{"profiles": [...]}`` body."""
+    profiles = body.get("profiles") if isinstance(body, dict) else None
+    if not isinstance(profiles, list):
+        raise RequestError('body must be a JSON object with a "profiles" list')
+    if len(profiles) > MAX_BATCH_PROFILES:
+        raise RequestError(f"at most {MAX_BATCH_PROFILES:,} profiles per batch")
+    return [parse_profile(profile, f"profiles[{index}]") for index, profile in enumerate(profiles)]
+
+
+def parse_simulation(body):
+    """Validated ``simulate_retirement`` arguments from a request body."""
+    if not isinstance(body, dict):
+        raise RequestError("body must be a JSON object")
+    unknown = sorted(set(body) - set(SIMULATION_FIELDS) - {"percentiles"})
+    if unknown:
+        raise RequestError(f"unknown fields: {', '.join(unknown)}")
+    missing = [name for name, (required, _) in SIMULATION_FIELDS.items() if required and name not in body]
+    if missing:
+        raise RequestError(f"missing fields: {', '.join(missing)}")
+
+    kwargs = {name: _number(body.get(name, default), name) for name, (_, default) in SIMULATION_FIELDS.items()}
+    kwargs["years_to_retirement"] = _integer(body["years_to_retirement"], "years_to_retirement", 0, MAX_SIMULATION_YEARS)
+    kwargs["n_paths"] = _integer(kwargs["n_paths"], "n_paths", 1, MAX_SIMULATION_PATHS)
+    kwargs["seed"] = _integer(kwargs["seed"], "seed", 0, 2 ** 32 - 1)
+    if kwargs["mean_return"] <= -1:
+        raise RequestError("mean_return must be greater than -1")
+    if kwargs["volatility"] < 0:
+        raise RequestError("volatility must not be negative")
+    percentiles = body.get("percentiles", list(DEFAULT_PERCENTILES))
+    if not isinstance(percentiles, list) or not percentiles or not all(
+            0 <= _number(p, "percentiles") <= 100 for p in percentiles):
+        raise RequestError("percentiles must be a non-empty list of numbers from 0 to 100")
+    kwargs["percentiles"] = tuple(percentiles)
+    return kwargs
+
+
+def _json_value(value):
+    # NumPy scalars as Python ones, NaN and infinities as null
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _encode(result):
+    return json.dumps(result, allow_nan=False, separators=(",", ":")).encode()
+
+
+def score_records(profiles, rules=DEFAULT_RULE_SET):
+    """Scores, forecasts and recommendations for a list of profile dicts, as JSON-ready dicts."""
+    if not profiles:
+        return []
+    data = {field: np.array([profile.get(field, default) for profile in profiles], dtype=float)
+            for field, default in PROFILE_DEFAULTS.items()}
+    results = {name: values.tolist() if isinstance(values, np.ndarray) else values
+               for name, values in score_columns(data, rules, separator=None).items()}
+    return [{name: _json_value(values[row]) for name, values in results.items()} for row in range(len(profiles))]
+
+
+def score_response(profiles, rules=DEFAULT_RULE_SET, single=False):
+    """JSON body for ``/score`` (``single``) or ``/score/batch``."""
+    results = score_records(profiles, rules)
+    return _encode(results[0] if single else {"results": results})
+
+
+def simulation_response(kwargs):
+    """JSON body for ``/simulate/retirement``: percentile bands by year and the success probability."""
+    result = simulate_retirement(**kwargs)
+    return _encode({
+        "years": result.years.tolist(),
+        "percentiles": {f"{p:g}": np.round(band, 2).tolist() for p, band in result.percentiles.items()},
+        "median_final_balance": round(float(np.median(result.final_balances)), 2),
+        "success_probability": float(result.success_probability),
+    })
+
+
+class ResponseCache:
+    """Encoded responses keyed by a hash of the endpoint and canonical request JSON.
+
+    Least recently used entries are evicted beyond ``max_entries`` or once
+    the finished responses add up to more than ``max_bytes`` (a response
+    bigger than that is served but not kept), and entries expire after
+    ``ttl`` seconds. The cached value is the pending computation itself, so
+    concurrent identical requests await one result; failed computations are
+    dropped rather than cached. Only used from the event loop, so it needs no
+    lock.
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> [expiry time, future, response bytes (0 while pending)]
+
+    @staticmethod
+    def key(path, body):
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{path}\n{canonical}".encode()).hexdigest()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _pop(self, key=None):
+        # Drop ``key``, or the least recently used entry
+        entry = self._entries.popitem(last=False)[1] if key is None else self._entries.pop(key)
+        self.bytes -= entry[2]
+
+    def _finished(self, key, future):
+        entry = self._entries.get(key)
+        if entry is None or entry[1] is not future or future.cancelled() or future.exception() is not None:
+            return
+        entry[2] = len(future.result())
+        self.bytes += entry[2]
+        if entry[2] > self.max_bytes:
+            # Too big to keep; evicting everything else wouldn't make room
+            self._pop(key)
+            return
+        while self.bytes > self.max_bytes:
+            self._pop()
+
+    async def get(self, key, compute):
+        """``(response, hit)`` for ``key``, awaiting ``compute()`` on a miss."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        hit = entry is not None and entry[0] > now
+        if hit:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            future = entry[1]
+        else:
+            self.misses += 1
+            if entry is not None:
+                self._pop(key)
+            future = asyncio.ensure_future(compute())
+            self._entries[key] = [now + self.ttl, future, 0]
+            future.add_done_callback(partial(self._finished, key))
+            while len(self._entries) > self.max_entries:
+                self._pop()
+
+        try:
+            # Shielded so one client disconnecting doesn't cancel the shared work
+            return await asyncio.shield(future), hit
+        except Exception:
+            if self._entries.get(key, (None, None))[1] is future:
+                self._pop(key)
+            raise
+
+
+def create_app(rules=DEFAULT_RULE_SET, workers=None, cache_max_entries=CACHE_MAX_ENTRIES, cache_ttl=CACHE_TTL_SECONDS,
+               cache_max_bytes=CACHE_MAX_BYTES, max_body_bytes=MAX_BODY_BYTES):
+    """The Starlette application; ``workers`` sizes the process pool (default: all cores)."""
+    cache = ResponseCache(cache_max_entries, cache_ttl, cache_max_bytes)
+    pool = None
+
+    @asynccontextmanager
+    async def lifespan(app):
+        nonlocal pool
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield
+        finally:
+            if sys.version_info >= (3, 9):
+                pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                pool.shutdown(wait=False)
+
+    async def run(func, use_pool):
+        # Threads for quick work; the process pool for anything CPU-heavy
+        return await asyncio.get_running_loop().run_in_executor(pool if use_pool else None, func)
+
+    def prepare(path, raw, parse):
+        # Decoding, validation and hashing of large batches take a while too
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise RequestError("request body must be valid JSON") from None
+        return parse(body), cache.key(path, body)
+
+    async def read_body(request):
+        # Refused from the declared length when there is one, otherwise as soon as the stream passes the limit
+        too_large = BodyTooLarge(f"request body must be at most {max_body_bytes:,} bytes")
+        length = request.headers.get("content-length", "")
+        if length.isdigit() and int(length) > max_body_bytes:
+            raise too_large
+        chunks, size = [], 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > max_body_bytes:
+                raise too_large
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def respond(request, parse, compute):
+        try:
+            parsed, key = await run(partial(prepare, request.url.path, await read_body(request), parse), False)
+        except RequestError as exc:
+            return JSONResponse({"error": str(exc)}, status_code=exc.status_code)
+
+        content, hit = await cache.get(key, lambda: compute(parsed))
+        return Response(content, media_type="application/json", headers={"X-Cache": "hit" if hit else "miss"})
+
+    async def health(request):
+        return JSONResponse({"status": "ok", "cache_entries": len(cache), "cache_bytes": cache.bytes, "cache_hits": cache.hits,
+                             "cache_misses": cache.misses})
+
+    async def score(request):
+        return await respond(request, parse_profile,
+                             lambda profile: run(partial(score_response, [profile], rules, single=True), False))
+
+    async def score_batch(request):
+        return await respond(request, parse_batch, lambda profiles: run(
+            partial(score_response, profiles, rules), len(profiles) >= PROCESS_POOL_MIN_PROFILES))
+
+    async def simulate(request):
+        return await respond(request, parse_simulation, lambda kwargs: run(partial(simulation_response, kwargs), True))
+
+    return Starlette(
+        routes=[
+            Route("/health", health, methods=["GET"]),
+            Route("/score", score, methods=["POST"]),
+            Route("/score/batch", score_batch, methods=["POST"]),
+            Route("/simulate/retirement", simulate, methods=["POST"]),
+        ],
+        lifespan=lifespan,
+    )
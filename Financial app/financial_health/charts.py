@@ -0,0 +1,344 @@
+"""Plotly figure builders for the dashboard.
+
+Each builder takes only the values the figure depends on, so the app can cache
+figures keyed on exactly that input subset. Plotly is imported inside the
+builders so it is only loaded once a figure is actually rendered.
+"""
+
+import numpy as np
+
+MAX_MARKER_POINTS = 61
+
+
+def cash_flow_figure(total_monthly_income, total_monthly_expenses, total_debt_payment, monthly_savings):
+    """Bar chart of monthly income, expenses, debt payments and savings."""
+    import plotly.graph_objects as go
+
+    categories = ['Income', 'Expenses', 'Debt Payments', 'Savings']
+    values = [total_monthly_income, total_monthly_expenses, total_debt_payment, monthly_savings]
+    colors = ['#4CAF50', '#FF9800', '#F44336', '#2196F3']
+
+    fig = go.Figure(data=[go.Bar(
+        x=categories,
+        y=values,
+        marker_color=colors
+    )])
+
+    fig.update_layout(
+        title="Monthly Cash Flow",
+        xaxis_title="Category",
+        yaxis_title="Amount ($)",
+        height=400
+    )
+    return fig
+
+
+def health_gauge_figure(financial_health_score):
+    """Gauge chart for the overall 0-100 financial health score."""
+    import plotly.graph_objects as go
+
+    return go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = financial_health_score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Financial Health Score"},
+        gauge = {
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 30], 'color': "#F44336"},
+                {'range': [30, 60], 'color': "#FFC107"},
+                {'range': [60, 100], 'color': "#4CAF50"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': financial_health_score
+            }
+        }
+    ))
+
+
+def expense_pie_figure(expense_labels, expense_values):
+    """Donut chart of the non-zero expense categories."""
+    # Built with graph_objects rather than plotly.express, which would pull in
+    # pandas; importing pandas while other sessions render figures races with
+    # plotly's checks for pandas objects
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+
+    non_zero_labels = [label for label, value in zip(expense_labels, expense_values) if value > 0]
+    non_zero_values = [value for value in expense_values if value > 0]
+
+    fig = go.Figure(go.Pie(
+        values=non_zero_values,
+        labels=non_zero_labels,
+        hole=0.4,
+        hovertemplate='label=%{label}<br>value=%{value}<extra></extra>',
+        legendgroup='',
+        name='',
+        showlegend=True,
+        domain=dict(x=[0.0, 1.0], y=[0.0, 1.0])
+    ))
+
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(
+        title="Monthly Expenses Breakdown",
+        piecolorway=qualitative.Set2,
+        legend=dict(tracegroupgap=0),
+        height=500
+    )
+    return fig
+
+
+def budget_comparison_figure(needs, wants, savings_debt):
+    """Grouped bars comparing the current budget split with the 50/30/20 rule."""
+    import plotly.graph_objects as go
+
+    categories = ['Needs', 'Wants', 'Savings & Debt']
+
+    fig = go.Figure(data=[
+        go.Bar(name='Current', x=categories, y=[needs, wants, savings_debt]),
+        go.Bar(name='Ideal', x=categories, y=[50, 30, 20])
+    ])
+
+    fig.update_layout(
+        barmode='group',
+        title='Your Budget vs. 50/30/20 Rule',
+        xaxis_title='Category',
+        yaxis_title='Percentage of Income (%)',
+        height=400
+    )
+    return fig
+
+
+def goal_forecast_figure(years, projected_savings, goal_amount, selected_goal):
+    """Projected savings (from ``forecast.goal_projection``) against the goal amount."""
+    import plotly.graph_objects as go
+
+    # Markers only help on short series; long ones are drawn as plain lines
+    show_markers = len(years) <= MAX_MARKER_POINTS
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=projected_savings,
+        mode='lines+markers' if show_markers else 'lines',
+        name='Projected Savings',
+        line=dict(color='#2196F3', width=3)
+    ))
+
+    # A flat line only needs its two end points
+    fig.add_trace(go.Scatter(
+        x=[years[0], years[-1]],
+        y=[goal_amount, goal_amount],
+        mode='lines',
+        name='Goal Amount',
+        line=dict(color='#F44336', width=2, dash='dash')
+    ))
+
+    fig.update_layout(
+        title=f"Savings Projection for {selected_goal}",
+        xaxis_title='Years',
+        yaxis_title='Amount ($)',
+        height=400
+    )
+    return fig
+
+
+def retirement_bands_figure(ages, percentiles):
+    """Fan chart of simulated retirement balances by age.
+
+    ``percentiles`` maps a percentile to the balance at each age, as returned
+    by ``simulate_retirement``; the outer and inner pairs are shaded as bands.
+    """
+    import plotly.graph_objects as go
+
+    levels = sorted(percentiles)
+    fig = go.Figure()
+
+    for low, high, opacity in [(levels[0], levels[-1], 0.15), (levels[1], levels[-2], 0.3)]:
+        fig.add_trace(go.Scatter(
+            x=ages,
+            y=percentiles[high],
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=ages,
+            y=percentiles[low],
+            mode='lines',
+            line=dict(width=0),
+            fill='tonexty',
+            fillcolor=f'rgba(33, 150, 243, {opacity})',
+            name=f'{low}th-{high}th Percentile'
+        ))
+
+    median = levels[len(levels) // 2]
+    fig.add_trace(go.Scatter(
+        x=ages,
+        y=percentiles[median],
+        mode='lines',
+        name='Median',
+        line=dict(color='#2196F3', width=3)
+    ))
+
+    fig.update_layout(
+        title="Simulated Retirement Savings",
+        xaxis_title='Age',
+        yaxis_title='Amount ($)',
+        height=400
+    )
+    return fig
+
+
+def debt_payoff_figure(balances, debt_names):
+    """Stacked area chart of each debt's balance over the payoff plan.
+
+    ``balances`` is a (months + 1, debts) history; debts that start at zero
+    are left out.
+    """
+    import plotly.graph_objects as go
+
+    months = np.arange(len(balances))
+    fig = go.Figure()
+
+    for name, series in zip(debt_names, np.asarray(balances).T):
+        if series[0] <= 0:
+            continue
+        fig.add_trace(go.Scatter(
+            x=months / 12,
+            y=series,
+            mode='lines',
+            stackgroup='debts',
+            name=name
+        ))
+
+    fig.update_layout(
+        title="Debt Balances Over Time",
+        xaxis_title='Years',
+        yaxis_title='Balance ($)',
+        height=400
+    )
+    return fig
+
+
+def goal_plan_figure(contributions, goal_names):
+    """Stacked area chart of the monthly contribution to each goal from ``planner.plan_goals``.
+
+    ``contributions`` is a (months, goals) array.
+    """
+    import plotly.graph_objects as go
+
+    contributions = np.asarray(contributions)
+    months = np.arange(1, len(contributions) + 1)
+    fig = go.Figure()
+
+    for name, series in zip(goal_names, contributions.T):
+        fig.add_trace(go.Scatter(
+            x=months / 12,
+            y=series,
+            mode='lines',
+            stackgroup='goals',
+            name=name
+        ))
+
+    fig.update_layout(
+        title="Monthly Savings by Goal",
+        xaxis_title='Years',
+        yaxis_title='Monthly Contribution ($)',
+        height=400
+    )
+    return fig
+
+
+def net_worth_projection_figure(ages, net_worth, real_net_worth, retirement_age):
+    """Projected net worth (from ``projection.project_net_worth``), nominal and in today's dollars."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=ages,
+        y=net_worth,
+        mode='lines',
+        name='Net Worth',
+        line=dict(color='#2196F3', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=ages,
+        y=real_net_worth,
+        mode='lines',
+        name="In Today's Dollars",
+        line=dict(color='#4CAF50', width=2, dash='dot')
+    ))
+    fig.add_vline(x=retirement_age, line=dict(color='#9E9E9E', width=1, dash='dash'))
+
+    fig.update_layout(
+        title="Long-Term Net Worth Projection",
+        xaxis_title='Age',
+        yaxis_title='Net Worth ($)',
+        height=400
+    )
+    return fig
+
+
+def progress_figure(dates, net_worth, financial_health_score):
+    """Net worth (left axis) and financial health score (right axis) over saved snapshots."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=net_worth,
+        mode='lines+markers' if len(dates) <= MAX_MARKER_POINTS else 'lines',
+        name='Net Worth',
+        line=dict(color='#2196F3', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=financial_health_score,
+        mode='lines',
+        name='Financial Health Score',
+        line=dict(color='#4CAF50', width=2, dash='dot'),
+        yaxis='y2'
+    ))
+
+    fig.update_layout(
+        title="Progress Over Time",
+        xaxis_title='Date',
+        yaxis_title='Net Worth ($)',
+        yaxis2=dict(title='Score', overlaying='y', side='right', range=[0, 100]),
+        height=400
+    )
+    return fig
+
+
+def sensitivity_heatmap_figure(x, y, retirement_income_ratio, x_title, y_title, target=70):
+    """Heatmap of retirement income (% of current income) over two what-if parameters.
+
+    ``retirement_income_ratio`` has one row per ``y`` value and one column per
+    ``x`` value; the colour scale is centred on the ``target`` ratio.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Heatmap(
+        x=x,
+        y=y,
+        z=np.round(retirement_income_ratio, 1),
+        zmin=0,
+        zmax=2 * target,
+        colorscale='RdYlGn',
+        colorbar=dict(title='% of Income'),
+        hovertemplate=f'{x_title}: %{{x}}<br>{y_title}: %{{y}}<br>Retirement income: %{{z}}%<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title="Retirement Income Sensitivity",
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+        height=500
+    )
+    return fig
@@ -0,0 +1,154 @@
+"""Headless batch scoring and the HTTP API, without a Streamlit server.
+
+    python -m financial_health score profiles.csv --out results.parquet
+    python -m financial_health serve --port 8000
+
+Each input row is one profile with the sidebar input columns (see
+``INPUT_COLUMNS``) plus, optionally, the forecast inputs in
+``FORECAST_DEFAULTS``. Rows are split into chunks and scored across a process
+pool with the same metric, recommendation and forecast logic as the dashboard,
+plus the long-term net worth milestones from ``projection``.
+``serve`` runs the same calculations behind the HTTP API in ``api``.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .forecast import goal_forecast, project_retirement
+from .projection import net_worth_milestones
+from .recommendations import EXPENSE_LABELS
+from .rules import DEFAULT_RULE_SET, load_rules
+from .scoring import EXPENSE_COLUMNS, INPUT_COLUMNS, score_arrays
+
+# Forecast inputs used when the file doesn't provide them (the dashboard defaults)
+FORECAST_DEFAULTS = {
+    "goal_amount": 30000,
+    "goal_timeline_years": 5,
+    "current_age": 30,
+    "retirement_age": 65,
+    "expected_annual_return": 0.07,
+}
+DEFAULT_CHUNKSIZE = 50_000
+RECOMMENDATION_SEPARATOR = " | "
+
+
+def read_table(path):
+    """Read a CSV or Parquet file, chosen by extension."""
+    return pd.read_parquet(path) if path.lower().endswith(".parquet") else pd.read_csv(path)
+
+
+def write_table(df, path):
+    """Write a CSV or Parquet file, chosen by extension."""
+    if path.lower().endswith(".parquet"):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def score_columns(data, rules=DEFAULT_RULE_SET, separator=RECOMMENDATION_SEPARATOR):
+    """Scores, forecasts and recommendations from a mapping of column -> NumPy array.
+
+    ``data`` needs every column in ``INPUT_COLUMNS`` and ``FORECAST_DEFAULTS``.
+    Returns a dict of equal-length results; each row's recommendations are
+    joined with ``separator``, or kept as lists when it is None.
+    """
+    scores = score_arrays(data, rules)
+    goal = goal_forecast(scores["monthly_savings"], data["goal_amount"], data["goal_timeline_years"])
+    retirement = project_retirement(
+        data["retirement"], scores["monthly_savings"], scores["total_monthly_income"],
+        data["retirement_age"] - data["current_age"], data["expected_annual_return"],
+    )
+    milestones = net_worth_milestones(
+        data, contribution_years=data["retirement_age"] - data["current_age"],
+        asset_returns={"investments": data["expected_annual_return"], "retirement": data["expected_annual_return"]},
+    )
+
+    # The rules run on whole columns, including joining each row's messages
+    metrics = {column: scores[column] for column in ["savings_rate", "debt_to_income", "emergency_months",
+                                                     "housing_to_income", "needs", "wants", "savings_debt"]}
+    metrics["credit_card"] = data["credit_card"]
+    expense_values = np.column_stack([data[column] for column in EXPENSE_COLUMNS] + [scores["total_debt_payment"]])
+    return {
+        **scores,
+        **goal,
+        **retirement,
+        **milestones,
+        "health_recommendations": rules.health_recommendations(metrics, separator),
+        "budget_recommendations": rules.budget_recommendations(metrics, expense_values, EXPENSE_LABELS, separator),
+    }
+
+
+def score_frame(df, rules=DEFAULT_RULE_SET, separator=RECOMMENDATION_SEPARATOR):
+    """Scores, forecasts and recommendations for every profile in ``df``, using the ``rules`` thresholds.
+
+    Each row's recommendations are joined with ``separator``, or kept as
+    lists when it is None.
+    """
+    df = df.reset_index(drop=True)
+    for column in INPUT_COLUMNS:
+        if column not in df:
+            df[column] = 0
+    for column, default in FORECAST_DEFAULTS.items():
+        if column not in df:
+            df[column] = default
+
+    data = {column: df[column].to_numpy(dtype=float) for column in INPUT_COLUMNS + list(FORECAST_DEFAULTS)}
+    return pd.concat([df, pd.DataFrame(score_columns(data, rules, separator))], axis=1)
+
+
+def score_file(input_path, output_path, workers=None, chunksize=DEFAULT_CHUNKSIZE, rules=DEFAULT_RULE_SET):
+    """Score every profile in ``input_path`` and write the results to ``output_path``."""
+    profiles = read_table(input_path)
+    chunks = [profiles.iloc[start:start + chunksize] for start in range(0, len(profiles), chunksize)]
+
+    if workers == 1 or len(chunks) <= 1:
+        results = [score_frame(chunk, rules) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(score_frame, chunks, [rules] * len(chunks)))
+
+    output = pd.concat(results, ignore_index=True) if results else score_frame(profiles, rules)
+    write_table(output, output_path)
+    return len(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m financial_health", description="Financial Health Dashboard batch tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="score a CSV/Parquet file of profiles")
+    score.add_argument("input", help="CSV or Parquet file with one profile per row")
+    score.add_argument("--out", required=True, help="output CSV or Parquet file")
+    score.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    score.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="profiles per worker task")
+    score.add_argument("--rules", help="JSON file of overrides to the default status and recommendation rules")
+
+    serve = commands.add_parser("serve", help="serve scores, forecasts and simulations as a JSON HTTP API")
+    serve.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    serve.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes for large batches and simulations")
+    serve.add_argument("--rules", help="JSON file of overrides to the default status and recommendation rules")
+
+    args = parser.parse_args(argv)
+    rules = load_rules(args.rules) if args.rules else DEFAULT_RULE_SET
+    if args.command == "score":
+        count = score_file(args.input, args.out, args.workers, args.chunksize, rules)
+        print(f"Scored {count:,} profiles -> {args.out}")
+    elif args.command == "serve":
+        try:
+            import uvicorn
+
+            from .api import create_app
+        except ImportError as exc:
+            raise ImportError("The HTTP API requires starlette and uvicorn (pip install starlette uvicorn)") from exc
+        uvicorn.run(create_app(rules, args.workers), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
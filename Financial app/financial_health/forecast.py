@@ -0,0 +1,134 @@
+"""Goal and retirement forecasts.
+
+The forecast functions accept scalars or equal-length arrays, so the
+dashboard and batch jobs share the same formulas.
+"""
+
+import numpy as np
+
+RETIREMENT_SHARE = 0.5  # Share of monthly savings assumed to go to retirement
+WITHDRAWAL_RATE = 0.04  # 4% rule
+INCOME_REPLACEMENT_TARGET = 70  # % of current income considered sufficient in retirement
+
+# Bounds on the plotted goal projection, so its size doesn't grow with the
+# distance to the goal
+MAX_PROJECTION_POINTS = 200
+MAX_PROJECTION_YEARS = 100
+
+
+def _monthly_rate(annual_return):
+    """Monthly rate compounding to ``annual_return`` over a year."""
+    return (1 + np.asarray(annual_return, dtype=float)) ** (1 / 12) - 1
+
+
+def goal_forecast(monthly_savings, goal_amount, goal_timeline_years, annual_return=0.0):
+    """Years to reach a savings goal at the current savings rate.
+
+    Savings are deposited monthly and, with a non-zero ``annual_return``,
+    compound monthly at the equivalent monthly rate. ``years_to_goal`` is
+    infinite where nothing is being saved.
+    """
+    monthly_savings = np.asarray(monthly_savings, dtype=float)
+    annual_savings = monthly_savings * 12
+    rate = _monthly_rate(annual_return)
+    months = np.asarray(goal_timeline_years) * 12
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Linear without returns; otherwise solve goal = s * ((1 + i)^m - 1) / i for m
+        linear_years = goal_amount / annual_savings
+        compound_years = np.log1p(goal_amount * rate / monthly_savings) / np.log1p(rate) / 12
+        years_to_goal = np.where(annual_savings > 0, np.where(rate > 0, compound_years, linear_years), np.inf)
+
+        required_monthly_savings = np.where(rate > 0, goal_amount * rate / np.expm1(months * np.log1p(rate)), goal_amount / months)
+
+    return {
+        "annual_savings": annual_savings,
+        "years_to_goal": years_to_goal,
+        "goal_on_track": years_to_goal <= goal_timeline_years,
+        "required_monthly_savings": required_monthly_savings,
+        "savings_gap": required_monthly_savings - monthly_savings,
+    }
+
+
+def goal_projection(monthly_savings, goal_amount, years_to_goal, annual_return=0.0, resolution="annual",
+                    max_points=MAX_PROJECTION_POINTS, max_years=MAX_PROJECTION_YEARS):
+    """Projected savings balance over time, for plotting against the goal.
+
+    Covers whole years (or months, with ``resolution="monthly"``) up to the
+    year the goal is reached, capped at ``max_years``. Balances come from the
+    closed-form future value at each time step, so when there are more than
+    ``max_points`` steps the series is evenly downsampled instead of computed
+    in full. Returns ``(years, balances, capped)``.
+    """
+    horizon = min(int(np.ceil(years_to_goal)), max_years)
+    capped = years_to_goal > max_years
+    steps_per_year = 12 if resolution == "monthly" else 1
+
+    steps = horizon * steps_per_year
+    if steps + 1 > max_points:
+        years = np.linspace(0, horizon, max_points)
+    else:
+        years = np.arange(steps + 1) / steps_per_year if steps_per_year > 1 else np.arange(steps + 1)
+
+    monthly_savings = float(monthly_savings)
+    rate = _monthly_rate(annual_return)
+    if rate > 0:
+        balances = monthly_savings * np.expm1(years * 12 * np.log1p(rate)) / rate
+    else:
+        balances = monthly_savings * 12 * years
+    return years, balances, capped
+
+
+def project_retirement(retirement_savings, monthly_savings, total_monthly_income, years_to_retirement,
+                       expected_annual_return, retirement_share=RETIREMENT_SHARE, withdrawal_rate=WITHDRAWAL_RATE):
+    """Deterministic retirement projection with annual compounding.
+
+    Current retirement savings grow at ``expected_annual_return`` and
+    ``retirement_share`` of monthly savings is contributed at the end of each
+    year. Income in retirement follows the ``withdrawal_rate`` rule.
+    """
+    expected_annual_return = np.asarray(expected_annual_return, dtype=float)
+    total_monthly_income = np.asarray(total_monthly_income, dtype=float)
+    annual_retirement_contribution = np.asarray(monthly_savings, dtype=float) * retirement_share * 12
+
+    # Future value of current savings and of the contributions (an ordinary annuity)
+    growth = (1 + expected_annual_return) ** years_to_retirement
+    future_retirement_savings = retirement_savings * growth
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity_factor = np.where(expected_annual_return != 0, (growth - 1) / expected_annual_return, years_to_retirement)
+    future_value_contributions = annual_retirement_contribution * annuity_factor
+    total_retirement_savings = future_retirement_savings + future_value_contributions
+
+    monthly_retirement_income = total_retirement_savings * withdrawal_rate / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        retirement_income_ratio = np.where(total_monthly_income > 0, monthly_retirement_income / total_monthly_income * 100, 0.0)
+
+    return {
+        "annual_retirement_contribution": annual_retirement_contribution,
+        "future_retirement_savings": future_retirement_savings,
+        "total_retirement_savings": total_retirement_savings,
+        "monthly_retirement_income": monthly_retirement_income,
+        "retirement_income_ratio": retirement_income_ratio,
+        "retirement_on_track": retirement_income_ratio >= INCOME_REPLACEMENT_TARGET,
+    }
+
+
+def sensitivity_sweep(retirement_savings, monthly_savings, total_monthly_income, additional_savings, expected_returns,
+                      retirement_ages, current_ages, retirement_share=RETIREMENT_SHARE, withdrawal_rate=WITHDRAWAL_RATE):
+    """Retirement projection over every combination of four what-if parameters.
+
+    The 1-D grids are placed on separate axes and broadcast through
+    ``project_retirement`` in a single pass, so each result has shape
+    ``(len(additional_savings), len(expected_returns), len(retirement_ages),
+    len(current_ages))``, except that the contribution and the growth of
+    current savings keep length-1 axes where they don't vary. Combinations
+    where the current age is not below the retirement age are NaN and never
+    on track.
+    """
+    additional_savings = np.asarray(additional_savings, dtype=float)[:, None, None, None]
+    expected_returns = np.asarray(expected_returns, dtype=float)[None, :, None, None]
+    years_to_retirement = np.subtract.outer(np.asarray(retirement_ages, dtype=float), np.asarray(current_ages, dtype=float))
+    years_to_retirement[years_to_retirement <= 0] = np.nan
+
+    return project_retirement(retirement_savings, monthly_savings + additional_savings, total_monthly_income,
+                              years_to_retirement, expected_returns, retirement_share, withdrawal_rate)
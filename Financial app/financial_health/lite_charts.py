@@ -0,0 +1,219 @@
+"""Lightweight versions of the cash-flow, 50/30/20 and goal forecast charts.
+
+``*_spec`` builders return Vega-Lite specs (with the data inlined) for
+``st.vega_lite_chart``, which the Streamlit frontend renders without loading
+Plotly.js. ``*_svg`` builders return a static SVG document for ``st.image``,
+drawn here with no plotting library at all. Both mirror the titles, axes and
+colours of the Plotly builders in ``charts``.
+"""
+
+import math
+from html import escape
+
+import numpy as np
+
+# Plotly's default colours for the first two traces, used by the 50/30/20 chart
+CURRENT_COLOR = '#636efa'
+IDEAL_COLOR = '#EF553B'
+
+CASH_FLOW_CATEGORIES = ['Income', 'Expenses', 'Debt Payments', 'Savings']
+CASH_FLOW_COLORS = ['#4CAF50', '#FF9800', '#F44336', '#2196F3']
+BUDGET_CATEGORIES = ['Needs', 'Wants', 'Savings & Debt']
+IDEAL_SPLIT = [50, 30, 20]
+
+SVG_WIDTH = 700
+SVG_HEIGHT = 400
+_MARGIN = dict(left=80, right=20, top=50, bottom=60)
+
+
+def _round(values, digits=2):
+    return [round(float(value), digits) for value in values]
+
+
+def cash_flow_spec(total_monthly_income, total_monthly_expenses, total_debt_payment, monthly_savings):
+    """Vega-Lite bar chart of monthly income, expenses, debt payments and savings."""
+    values = _round([total_monthly_income, total_monthly_expenses, total_debt_payment, monthly_savings])
+    return {
+        "title": "Monthly Cash Flow",
+        "height": 400,
+        "data": {"values": [
+            {"category": category, "amount": value, "color": color}
+            for category, value, color in zip(CASH_FLOW_CATEGORIES, values, CASH_FLOW_COLORS)
+        ]},
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "category", "type": "nominal", "sort": None, "title": "Category", "axis": {"labelAngle": 0}},
+            "y": {"field": "amount", "type": "quantitative", "title": "Amount ($)"},
+            "color": {"field": "color", "type": "nominal", "scale": None, "legend": None},
+            "tooltip": [{"field": "category", "type": "nominal"}, {"field": "amount", "type": "quantitative", "format": "$,.2f"}],
+        },
+    }
+
+
+def budget_comparison_spec(needs, wants, savings_debt):
+    """Vega-Lite grouped bars comparing the current budget split with the 50/30/20 rule."""
+    current = _round([needs, wants, savings_debt], 1)
+    return {
+        "title": "Your Budget vs. 50/30/20 Rule",
+        "height": 400,
+        "data": {"values": [
+            {"category": category, "split": split, "percent": value}
+            for split, split_values in [("Current", current), ("Ideal", IDEAL_SPLIT)]
+            for category, value in zip(BUDGET_CATEGORIES, split_values)
+        ]},
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "category", "type": "nominal", "sort": None, "title": "Category", "axis": {"labelAngle": 0}},
+            "xOffset": {"field": "split", "sort": None},
+            "y": {"field": "percent", "type": "quantitative", "title": "Percentage of Income (%)"},
+            "color": {"field": "split", "type": "nominal", "title": None,
+                      "scale": {"domain": ["Current", "Ideal"], "range": [CURRENT_COLOR, IDEAL_COLOR]}},
+            "tooltip": [{"field": "category"}, {"field": "split"}, {"field": "percent", "type": "quantitative"}],
+        },
+    }
+
+
+def goal_forecast_spec(years, projected_savings, goal_amount, selected_goal):
+    """Vega-Lite projected savings (from ``forecast.goal_projection``) against the goal amount."""
+    from .charts import MAX_MARKER_POINTS
+
+    # Two layers sharing one colour scale: the projection as compact x/y rows
+    # and the goal as a rule, so the legend matches the Plotly version
+    colors = {"domain": ["Projected Savings", "Goal Amount"], "range": ["#2196F3", "#F44336"]}
+    return {
+        "title": f"Savings Projection for {selected_goal}",
+        "height": 400,
+        "layer": [
+            {
+                "data": {"values": [{"x": x, "y": y} for x, y in zip(_round(years, 3), _round(projected_savings))]},
+                "mark": {"type": "line", "strokeWidth": 3, "point": len(years) <= MAX_MARKER_POINTS},
+                "encoding": {
+                    "x": {"field": "x", "type": "quantitative", "title": "Years"},
+                    "y": {"field": "y", "type": "quantitative", "title": "Amount ($)"},
+                    "color": {"datum": "Projected Savings", "scale": colors, "title": None},
+                    "tooltip": [{"field": "x", "title": "Years", "format": ".1f"},
+                                {"field": "y", "title": "Amount ($)", "format": "$,.0f"}],
+                },
+            },
+            {
+                "mark": {"type": "rule", "strokeWidth": 2, "strokeDash": [6, 4]},
+                "encoding": {
+                    "y": {"datum": round(float(goal_amount), 2)},
+                    "color": {"datum": "Goal Amount", "scale": colors, "title": None},
+                },
+            },
+        ],
+    }
+
+
+def _nice_ticks(low, high, count=5):
+    """Round tick values covering ``low``..``high``, always including zero."""
+    low, high = min(low, 0.0), max(high, 0.0)
+    if high == low:
+        high = low + 1
+    raw_step = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(factor * magnitude for factor in (1, 2, 2.5, 5, 10) if factor * magnitude >= raw_step)
+    return np.arange(math.floor(low / step), math.ceil(high / step) + 1) * step
+
+
+def _format_tick(value):
+    if abs(value) >= 1_000_000:
+        return f"{value / 1_000_000:g}M"
+    if abs(value) >= 1_000:
+        return f"{value / 1_000:g}k"
+    return f"{value:g}"
+
+
+class _SvgCanvas:
+    """Plot area with a linear y axis, title and axis titles."""
+
+    def __init__(self, title, x_title, y_title, y_low, y_high):
+        self.ticks = _nice_ticks(y_low, y_high)
+        self.left, self.top = _MARGIN["left"], _MARGIN["top"]
+        self.width = SVG_WIDTH - _MARGIN["left"] - _MARGIN["right"]
+        self.height = SVG_HEIGHT - _MARGIN["top"] - _MARGIN["bottom"]
+        self.parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_WIDTH}" height="{SVG_HEIGHT}" '
+            f'viewBox="0 0 {SVG_WIDTH} {SVG_HEIGHT}" font-family="sans-serif" font-size="12">',
+            f'<text x="{SVG_WIDTH / 2}" y="24" text-anchor="middle" font-size="16">{escape(title)}</text>',
+            f'<text x="{self.left + self.width / 2}" y="{SVG_HEIGHT - 12}" text-anchor="middle">{escape(x_title)}</text>',
+            f'<text transform="translate(16 {self.top + self.height / 2}) rotate(-90)" text-anchor="middle">{escape(y_title)}</text>',
+        ]
+        for tick in self.ticks:
+            y = self.y(tick)
+            self.parts.append(f'<line x1="{self.left}" x2="{self.left + self.width}" y1="{y:.1f}" y2="{y:.1f}" stroke="#e5e5e5"/>')
+            self.parts.append(f'<text x="{self.left - 6}" y="{y + 4:.1f}" text-anchor="end">{_format_tick(tick)}</text>')
+
+    def y(self, value):
+        low, high = self.ticks[0], self.ticks[-1]
+        return self.top + self.height * (high - value) / (high - low)
+
+    def legend(self, items):
+        x = self.left + self.width
+        for index, (name, color) in enumerate(items):
+            y = self.top + 14 * index
+            self.parts.append(f'<rect x="{x - 110}" y="{y - 9}" width="10" height="10" fill="{color}"/>')
+            self.parts.append(f'<text x="{x - 95}" y="{y}">{escape(name)}</text>')
+
+    def render(self):
+        return "".join(self.parts + ["</svg>"])
+
+
+def _svg_bars(title, y_title, categories, series):
+    """Grouped bar chart; ``series`` is a list of (name, values, colors) with one colour per bar."""
+    values = [value for _, series_values, _ in series for value in series_values]
+    canvas = _SvgCanvas(title, "Category", y_title, min(values), max(values))
+    slot = canvas.width / len(categories)
+    bar_width = slot * 0.7 / len(series)
+    zero = canvas.y(0)
+
+    for index, category in enumerate(categories):
+        x = canvas.left + slot * index
+        canvas.parts.append(f'<text x="{x + slot / 2:.1f}" y="{canvas.top + canvas.height + 18}" text-anchor="middle">{escape(category)}</text>')
+        for offset, (_, series_values, colors) in enumerate(series):
+            top = canvas.y(max(series_values[index], 0))
+            height = abs(canvas.y(series_values[index]) - zero)
+            canvas.parts.append(f'<rect x="{x + slot * 0.15 + bar_width * offset:.1f}" y="{top:.1f}" '
+                                f'width="{bar_width:.1f}" height="{height:.1f}" fill="{colors[index]}"/>')
+    if len(series) > 1:
+        canvas.legend([(name, colors[0]) for name, _, colors in series])
+    return canvas.render()
+
+
+def cash_flow_svg(total_monthly_income, total_monthly_expenses, total_debt_payment, monthly_savings):
+    """Static SVG bar chart of monthly income, expenses, debt payments and savings."""
+    values = [float(total_monthly_income), float(total_monthly_expenses), float(total_debt_payment), float(monthly_savings)]
+    return _svg_bars("Monthly Cash Flow", "Amount ($)", CASH_FLOW_CATEGORIES, [("Amount", values, CASH_FLOW_COLORS)])
+
+
+def budget_comparison_svg(needs, wants, savings_debt):
+    """Static SVG grouped bars comparing the current budget split with the 50/30/20 rule."""
+    return _svg_bars("Your Budget vs. 50/30/20 Rule", "Percentage of Income (%)", BUDGET_CATEGORIES, [
+        ("Current", [float(needs), float(wants), float(savings_debt)], [CURRENT_COLOR] * 3),
+        ("Ideal", IDEAL_SPLIT, [IDEAL_COLOR] * 3),
+    ])
+
+
+def goal_forecast_svg(years, projected_savings, goal_amount, selected_goal):
+    """Static SVG projected savings (from ``forecast.goal_projection``) against the goal amount."""
+    years = np.asarray(years, dtype=float)
+    projected_savings = np.asarray(projected_savings, dtype=float)
+    canvas = _SvgCanvas(f"Savings Projection for {selected_goal}", "Years", "Amount ($)",
+                        min(projected_savings.min(), goal_amount), max(projected_savings.max(), goal_amount))
+
+    x_ticks = _nice_ticks(0, years[-1])
+    x_ticks = x_ticks[x_ticks <= years[-1]]
+    span = years[-1] - years[0] or 1
+    x = canvas.left + canvas.width * (years - years[0]) / span
+    for tick in x_ticks:
+        canvas.parts.append(f'<text x="{canvas.left + canvas.width * (tick - years[0]) / span:.1f}" '
+                            f'y="{canvas.top + canvas.height + 18}" text-anchor="middle">{_format_tick(tick)}</text>')
+
+    points = " ".join(f"{px:.1f},{canvas.y(py):.1f}" for px, py in zip(x, projected_savings))
+    canvas.parts.append(f'<polyline points="{points}" fill="none" stroke="#2196F3" stroke-width="3"/>')
+    goal_y = canvas.y(goal_amount)
+    canvas.parts.append(f'<line x1="{x[0]:.1f}" x2="{x[-1]:.1f}" y1="{goal_y:.1f}" y2="{goal_y:.1f}" '
+                        f'stroke="#F44336" stroke-width="2" stroke-dasharray="6 4"/>')
+    canvas.legend([("Projected Savings", "#2196F3"), ("Goal Amount", "#F44336")])
+    return canvas.render()
@@ -0,0 +1,166 @@
+"""Typed household profile: one as a slotted dataclass, many as a structured array.
+
+``Profile`` holds the 25 sidebar inputs (``INPUT_COLUMNS``) and works out
+its ``totals`` once, on first use. ``PROFILE_DTYPE`` is the same layout as
+a NumPy record (25 float64 fields, 200 bytes), so a batch of profiles is
+one contiguous array that ``score_arrays`` accepts directly, and
+``to_arrow`` / ``from_arrow`` convert it to and from an Arrow table with
+``arrow_schema()``.
+
+A profile serializes to a stable 200-byte record (``to_bytes``), which also
+gives a short cache ``key()``, or to a plain dict for JSON storage.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from .scoring import ASSET_COLUMNS, DEBT_COLUMNS, DEBT_PAYMENT_COLUMNS, EXPENSE_COLUMNS, INCOME_COLUMNS, INPUT_COLUMNS
+
+PROFILE_DTYPE = np.dtype([(column, "<f8") for column in INPUT_COLUMNS])
+
+
+@dataclass(frozen=True)
+class ProfileTotals:
+    """Totals derived from a profile, matching the ones ``score_arrays`` computes."""
+
+    __slots__ = ("total_monthly_income", "total_monthly_expenses", "total_debt", "total_debt_payment",
+                 "total_assets", "monthly_savings", "net_worth")
+    total_monthly_income: float
+    total_monthly_expenses: float
+    total_debt: float
+    total_debt_payment: float
+    total_assets: float
+    monthly_savings: float
+    net_worth: float
+
+
+@dataclass(frozen=True)
+class Profile:
+    """One household's sidebar inputs: monthly amounts and outstanding balances, in dollars.
+
+    Values are kept as given (the dashboard passes ints). Missing inputs
+    default to 0 in ``from_mapping``; ``get`` lets a ``Profile`` stand in
+    for a profile dict.
+    """
+
+    # Declared by hand rather than with slots=True so Python < 3.10 works too
+    __slots__ = tuple(INPUT_COLUMNS) + ("_totals",)
+    monthly_salary: float
+    side_income: float
+    other_income: float
+    housing: float
+    utilities: float
+    groceries: float
+    transportation: float
+    healthcare: float
+    entertainment: float
+    other_expenses: float
+    student_loan: float
+    car_loan: float
+    credit_card: float
+    mortgage: float
+    other_debt: float
+    student_loan_payment: float
+    car_loan_payment: float
+    credit_card_payment: float
+    mortgage_payment: float
+    other_debt_payment: float
+    emergency_fund: float
+    investments: float
+    retirement: float
+    property_value: float
+    other_assets: float
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Profile from a dict (or any mapping) of input column -> value; missing inputs are 0."""
+        return cls(*(mapping.get(column, 0) for column in INPUT_COLUMNS))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Profile from ``to_bytes`` output."""
+        return cls(*np.frombuffer(data, dtype=PROFILE_DTYPE)[0].tolist())
+
+    def as_tuple(self):
+        return tuple(getattr(self, column) for column in INPUT_COLUMNS)
+
+    def to_dict(self):
+        return dict(zip(INPUT_COLUMNS, self.as_tuple()))
+
+    def to_bytes(self):
+        """The profile as one ``PROFILE_DTYPE`` record."""
+        return np.array(self.as_tuple(), dtype=PROFILE_DTYPE).tobytes()
+
+    def key(self):
+        """Short stable digest of the values, for cache keys."""
+        return hashlib.blake2b(self.to_bytes(), digest_size=16).hexdigest()
+
+    def get(self, column, default=None):
+        return getattr(self, column, default) if column in INPUT_COLUMNS else default
+
+    @property
+    def totals(self):
+        """``ProfileTotals``, computed on first access and kept with the profile."""
+        try:
+            return self._totals
+        except AttributeError:
+            pass
+        # Summed in the same order as score_arrays, so the floats match exactly
+        income, expenses, debt, debt_payment, assets = (
+            float(sum(getattr(self, column) for column in columns))
+            for columns in (INCOME_COLUMNS, EXPENSE_COLUMNS, DEBT_COLUMNS, DEBT_PAYMENT_COLUMNS, ASSET_COLUMNS)
+        )
+        totals = ProfileTotals(income, expenses, debt, debt_payment, assets,
+                               income - expenses - debt_payment, assets - debt)
+        object.__setattr__(self, "_totals", totals)
+        return totals
+
+    def __reduce__(self):
+        # Pickle (and Streamlit's cache hashing) see only the inputs, never the cached totals
+        return self.__class__, self.as_tuple()
+
+
+def to_records(profiles):
+    """Structured ``PROFILE_DTYPE`` array from ``Profile`` objects or profile dicts."""
+    return np.array([profile.as_tuple() if isinstance(profile, Profile) else Profile.from_mapping(profile).as_tuple()
+                     for profile in profiles], dtype=PROFILE_DTYPE)
+
+
+def from_records(records):
+    """``Profile`` objects from a structured ``PROFILE_DTYPE`` array."""
+    return [Profile(*row) for row in np.asarray(records, dtype=PROFILE_DTYPE).tolist()]
+
+
+def frame_to_records(df):
+    """Structured ``PROFILE_DTYPE`` array from a DataFrame; missing input columns are 0."""
+    records = np.zeros(len(df), dtype=PROFILE_DTYPE)
+    for column in INPUT_COLUMNS:
+        if column in df:
+            records[column] = df[column].to_numpy(dtype=float)
+    return records
+
+
+def arrow_schema():
+    """Arrow schema matching ``PROFILE_DTYPE`` (requires pyarrow)."""
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("Arrow conversion requires pyarrow (pip install pyarrow)") from exc
+    return pa.schema([(column, pa.float64()) for column in INPUT_COLUMNS])
+
+
+def to_arrow(records):
+    """Arrow table from a structured ``PROFILE_DTYPE`` array, one column per input."""
+    import pyarrow as pa
+
+    return pa.Table.from_arrays([records[column] for column in INPUT_COLUMNS], schema=arrow_schema())
+
+
+def from_arrow(table):
+    """Structured ``PROFILE_DTYPE`` array from an Arrow table with ``arrow_schema()`` columns."""
+    records = np.empty(table.num_rows, dtype=PROFILE_DTYPE)
+    for column in INPUT_COLUMNS:
+        records[column] = table.column(column).to_numpy()
+    return records
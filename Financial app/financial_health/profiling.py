@@ -0,0 +1,120 @@
+"""Opt-in timing of the work done in one dashboard rerun.
+
+A ``RerunProfiler`` collects wall-clock timings for named steps (sidebar
+input reading, metric calculation, each section, each figure build and
+chart serialization) and can also capture a cProfile of the whole rerun.
+``record()`` returns the timings as a JSON-serializable dict and ``export()``
+writes it as one structured JSON log line.
+
+When disabled, ``timed`` returns a shared no-op context, ``wrap`` returns the
+function unchanged and ``lap`` returns straight away, so instrumented code
+costs next to nothing in normal use.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import logging
+import pstats
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_NO_OP = contextlib.nullcontext()
+_LOG_FILE_LOCK = threading.Lock()
+
+
+class RerunProfiler:
+    """Timings for one rerun; created at the top of the script."""
+
+    def __init__(self, enabled=False, cprofile=False):
+        self.enabled = enabled
+        self.timings = {}
+        self.cprofile_error = None
+        self._started = time.perf_counter()
+        self._last_lap = self._started
+        self._profile = None
+        self._finished = None
+
+        if enabled and cprofile:
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError as exc:
+                # Only one profiler can be active at a time on Python 3.12+
+                self._profile, self.cprofile_error = None, str(exc)
+
+    def _add(self, name, seconds):
+        calls, total = self.timings.get(name, (0, 0.0))
+        self.timings[name] = (calls + 1, total + seconds)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """Context manager adding the time spent inside it to ``name``."""
+        return self._timed(name) if self.enabled else _NO_OP
+
+    def wrap(self, name, func):
+        """``func``, timed under ``name`` on every call."""
+        if not self.enabled:
+            return func
+
+        def timed_func(*args, **kwargs):
+            with self._timed(name):
+                return func(*args, **kwargs)
+        return timed_func
+
+    def lap(self, name):
+        """Record the time since the previous lap (or the start) under ``name``."""
+        if self.enabled:
+            now = time.perf_counter()
+            self._add(name, now - self._last_lap)
+            self._last_lap = now
+
+    def finish(self):
+        """Stop the clock and any cProfile capture; returns the total seconds."""
+        if self._finished is None:
+            self._finished = time.perf_counter() - self._started
+            if self._profile is not None:
+                self._profile.disable()
+        return self._finished
+
+    def record(self, **fields):
+        """The rerun's timings as a JSON-serializable dict, plus any extra ``fields``."""
+        total = self.finish()
+        return {
+            "timestamp": time.time(),
+            "total_ms": round(total * 1000, 3),
+            "timings": {
+                name: {"calls": calls, "ms": round(seconds * 1000, 3)}
+                for name, (calls, seconds) in self.timings.items()
+            },
+            **fields,
+        }
+
+    def export(self, log_file=None, **fields):
+        """Log the record as one JSON line, also appending it to ``log_file`` if given; returns the record."""
+        record = self.record(**fields)
+        line = json.dumps(record)
+        logger.info(line)
+        if log_file:
+            with _LOG_FILE_LOCK, open(log_file, "a") as out:
+                out.write(line + "\n")
+        return record
+
+    def stats(self, limit=25, sort="cumulative"):
+        """The top ``limit`` functions from the cProfile capture, as text ('' without one)."""
+        if self._profile is None:
+            return ""
+        self.finish()
+        out = io.StringIO()
+        pstats.Stats(self._profile, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -0,0 +1,162 @@
+"""Long-horizon net worth projection with inflation and income growth.
+
+Month by month, each asset class compounds at its own return, savings are
+paid in at the end of each month and rise every year with salary growth
+(plus any contribution escalation), and each debt amortizes at its APR,
+its payment joining savings once it is paid off. Balances come from closed-
+form sums of the discounted contributions, so a 50-year monthly trajectory
+is one broadcast expression over the months, and batch jobs can evaluate
+only the months they need for any number of profiles.
+
+Assumptions can be scalars or arrays that broadcast against the profile
+columns; results have the profile shape plus a trailing months axis.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .forecast import RETIREMENT_SHARE
+from .profile import Profile
+from .scoring import ASSET_COLUMNS, DEBT_COLUMNS, DEBT_PAYMENT_COLUMNS, EXPENSE_COLUMNS, INCOME_COLUMNS
+
+PROJECTION_YEARS = 50
+INFLATION = 0.025
+SALARY_GROWTH = 0.03
+CONTRIBUTION_ESCALATION = 0.0  # Yearly rise in contributions on top of salary growth
+
+ASSET_RETURNS = {"emergency_fund": 0.02, "investments": 0.07, "retirement": 0.07, "property_value": 0.035, "other_assets": 0.0}
+DEBT_RATES = {"student_loan": 0.055, "car_loan": 0.07, "credit_card": 0.22, "mortgage": 0.065, "other_debt": 0.08}  # Sidebar defaults
+CONTRIBUTION_SPLIT = {"retirement": RETIREMENT_SHARE, "investments": 1 - RETIREMENT_SHARE}  # Where monthly savings go
+
+MILESTONE_YEARS = (10, 30, 50)  # Horizons reported by net_worth_milestones
+
+
+@dataclass
+class NetWorthProjection:
+    """Projected balances at each requested month."""
+
+    months: np.ndarray  # (months,) months from now
+    assets: dict  # asset column -> (..., months) balance
+    debt: np.ndarray  # (..., months) total outstanding debt
+    net_worth: np.ndarray  # (..., months) assets less debt
+    real_net_worth: np.ndarray  # (..., months) net worth in today's dollars
+    monthly_income: np.ndarray  # (..., months) income after salary growth
+    monthly_contribution: np.ndarray  # (..., months) savings paid in that month, including freed debt payments
+    price_level: np.ndarray  # (..., months) cumulative inflation; divide by it for today's dollars
+
+
+def _column(value):
+    return np.asarray(value, dtype=float)[..., None]
+
+
+def _annuity(log_discount, n):
+    """``v + v**2 + ... + v**n`` for ``v = exp(log_discount)``, accurate when ``v`` is close to 1."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(log_discount == 0, n, np.exp(log_discount) * np.expm1(n * log_discount) / np.expm1(log_discount))
+
+
+def _geometric(log_ratio, n):
+    """``1 + q + ... + q**(n - 1)`` for ``q = exp(log_ratio)``."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(log_ratio == 0, n, np.expm1(n * log_ratio) / np.expm1(log_ratio))
+
+
+def _payoff_month(balance, rate, payment):
+    """Months of ``payment`` that clear ``balance`` at monthly ``rate``; inf if interest outpaces the payment."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # balance * (1 + i)^n = payment * ((1 + i)^n - 1) / i, solved for n
+        compound = np.ceil(-np.log1p(-balance * rate / payment) / np.log1p(rate))
+        months = np.where(rate > 0, compound, np.ceil(balance / payment))
+    return np.where(balance <= 0, 0.0, np.where((payment > 0) & (payment > balance * rate), months, np.inf))
+
+
+def project_net_worth(data, years=PROJECTION_YEARS, months=None, inflation=INFLATION, salary_growth=SALARY_GROWTH,
+                      contribution_escalation=CONTRIBUTION_ESCALATION, contribution_years=None, asset_returns=None,
+                      debt_rates=None, contribution_split=None):
+    """Net worth trajectory for a ``Profile`` or a mapping of ``INPUT_COLUMNS`` -> scalar or array.
+
+    Evaluated at ``months`` (default: every month for ``years`` years).
+    ``asset_returns`` and ``debt_rates`` (annual) override entries of
+    ``ASSET_RETURNS`` and ``DEBT_RATES``; ``contribution_split`` replaces
+    ``CONTRIBUTION_SPLIT``. Monthly savings (income less expenses and debt
+    payments, floored at 0) stop after ``contribution_years`` if given; debts
+    keep being paid either way.
+    """
+    if isinstance(data, Profile):
+        data = data.to_dict()
+    asset_returns = {**ASSET_RETURNS, **(asset_returns or {})}
+    debt_rates = {**DEBT_RATES, **(debt_rates or {})}
+    contribution_split = CONTRIBUTION_SPLIT if contribution_split is None else contribution_split
+    months = np.arange(int(years) * 12 + 1) if months is None else np.asarray(months)
+    t = months.astype(float)
+
+    income = _column(sum(np.asarray(data[column], dtype=float) for column in INCOME_COLUMNS))
+    expenses = sum(np.asarray(data[column], dtype=float) for column in EXPENSE_COLUMNS)
+    debt_payment = sum(np.asarray(data[column], dtype=float) for column in DEBT_PAYMENT_COLUMNS)
+    savings = np.maximum(income - _column(expenses + debt_payment), 0)
+
+    # Contributions are paid in months 1..paid_months; each year's are `growth` times the last year's
+    log_growth = np.log1p(_column(salary_growth)) + np.log1p(_column(contribution_escalation))
+    paid_months = t if contribution_years is None else np.minimum(t, np.maximum(_column(contribution_years), 0) * 12)
+    full_years, extra_months = np.floor(paid_months / 12), paid_months % 12
+
+    # Debts amortize at APR / 12 (as in the debt module); paid-off debts free up their payment
+    debt = 0.0
+    freed = []  # (payment, payoff month) per debt that does get paid off
+    for column, payment_column in zip(DEBT_COLUMNS, DEBT_PAYMENT_COLUMNS):
+        balance, payment = _column(data[column]), _column(data[payment_column])
+        rate = _column(debt_rates[column]) / 12
+        growth = (1 + rate) ** t
+        with np.errstate(divide="ignore", invalid="ignore"):
+            paid = payment * np.where(rate > 0, (growth - 1) / rate, t)
+        debt = debt + np.maximum(balance * growth - paid, 0)
+        payoff = _payoff_month(balance, rate, payment)
+        paid_off = np.isfinite(payoff)
+        freed.append((np.where(paid_off, payment, 0.0), np.where(paid_off, payoff, 0.0)))
+
+    assets = {}
+    for column in ASSET_COLUMNS:
+        log_discount = -np.log1p(_column(asset_returns.get(column, 0.0))) / 12
+        share = contribution_split.get(column, 0.0)
+        discounted = _column(data[column])
+        if share:
+            # Present value of the escalating savings: whole years, then the months of the current one
+            log_ratio = log_growth + 12 * log_discount
+            escalating = (_annuity(log_discount, 12) * _geometric(log_ratio, full_years)
+                          + np.exp(full_years * log_ratio) * _annuity(log_discount, extra_months))
+            released = sum(payment * np.exp(payoff * log_discount) * _annuity(log_discount, np.maximum(paid_months - payoff, 0))
+                           for payment, payoff in freed)
+            discounted = discounted + share * (savings * escalating + released)
+        assets[column] = discounted * np.exp(-t * log_discount)
+
+    total_assets = sum(assets.values())
+    net_worth = total_assets - debt
+    price_level = np.exp(t / 12 * np.log1p(_column(inflation)))
+    year = np.floor(np.maximum(t - 1, 0) / 12)
+    contributing = (t >= 1) & (t <= paid_months)
+    freed_now = sum(payment * (t > payoff) for payment, payoff in freed)
+    return NetWorthProjection(
+        months=months,
+        assets=assets,
+        debt=debt * np.ones_like(net_worth),
+        net_worth=net_worth,
+        real_net_worth=net_worth / price_level,
+        monthly_income=income * np.exp(np.floor(t / 12) * np.log1p(_column(salary_growth))),
+        monthly_contribution=np.where(contributing, savings * np.exp(year * log_growth) + freed_now, 0.0),
+        price_level=price_level * np.ones_like(net_worth),
+    )
+
+
+def net_worth_milestones(data, horizons=MILESTONE_YEARS, **assumptions):
+    """Nominal and real (today's dollars) net worth after each of ``horizons`` years, for batch scoring.
+
+    Takes the same ``data`` and assumptions as ``project_net_worth`` and
+    returns ``net_worth_{years}y`` and ``real_net_worth_{years}y`` columns.
+    """
+    projection = project_net_worth(data, months=np.asarray(horizons) * 12, **assumptions)
+    columns = {}
+    for index, years in enumerate(horizons):
+        columns[f"net_worth_{years}y"] = projection.net_worth[..., index]
+        columns[f"real_net_worth_{years}y"] = projection.real_net_worth[..., index]
+    return columns
@@ -0,0 +1,27 @@
+"""Personalized recommendations shown on the Financial Health and Expense Breakdown pages.
+
+The thresholds and wording live in the rule table in ``rules``; these
+helpers evaluate it for one profile. Batch jobs call the ``RuleSet`` methods
+directly on whole columns and get the same text.
+"""
+
+from .rules import DEFAULT_RULE_SET
+
+EXPENSE_LABELS = ['Housing', 'Utilities', 'Groceries', 'Transportation', 'Healthcare', 'Entertainment', 'Other Expenses', 'Debt Payments']
+
+
+def health_recommendations(savings_rate, debt_to_income, emergency_months, housing_to_income, credit_card, rules=DEFAULT_RULE_SET):
+    """Recommendations based on the financial health ratios."""
+    return rules.health_recommendations({
+        "savings_rate": savings_rate,
+        "debt_to_income": debt_to_income,
+        "emergency_months": emergency_months,
+        "housing_to_income": housing_to_income,
+        "credit_card": credit_card,
+    })[0]
+
+
+def budget_recommendations(needs, wants, savings_debt, expense_values, rules=DEFAULT_RULE_SET):
+    """Budget suggestions from the 50/30/20 split; ``expense_values`` follow ``EXPENSE_LABELS``."""
+    return rules.budget_recommendations({"needs": needs, "wants": wants, "savings_debt": savings_debt},
+                                        [list(expense_values)], EXPENSE_LABELS)[0]
@@ -0,0 +1,63 @@
+"""Monte Carlo retirement simulator.
+
+Annual returns for every path and year are drawn at once as a (years x paths)
+matrix, and balances are rolled forward with cumulative products instead of a
+Python loop, so 100k paths over a 57-year horizon stay interactive.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a Monte Carlo retirement simulation."""
+
+    years: np.ndarray  # 0..horizon
+    percentiles: dict  # percentile -> balance at each year
+    final_balances: np.ndarray  # balance at retirement for every path
+    success_probability: float  # share of paths reaching the target balance
+
+
+def simulate_retirement(retirement_savings, annual_contribution, years_to_retirement, mean_return, volatility,
+                        n_paths=10_000, target_balance=0.0, percentiles=DEFAULT_PERCENTILES, seed=None):
+    """Simulate retirement balances over ``n_paths`` random return paths.
+
+    Annual returns are lognormal with the given arithmetic ``mean_return`` and
+    ``volatility`` (both as fractions). Contributions are added at the end of
+    each year, matching the deterministic future-value formula used in the app.
+    """
+    horizon = max(int(years_to_retirement), 0)
+    rng = np.random.default_rng(seed)
+
+    # Lognormal parameters matching the requested mean and volatility of 1 + r
+    sigma2 = np.log1p(volatility ** 2 / (1 + mean_return) ** 2)
+    mu = np.log1p(mean_return) - sigma2 / 2
+
+    # Work on a (years x paths) matrix so each year's paths are contiguous for
+    # the percentile step, which dominates the runtime
+    balances = np.empty((horizon + 1, n_paths))
+    balances[0] = retirement_savings
+    log_growth = rng.standard_normal(size=(horizon, n_paths))
+    log_growth *= np.sqrt(sigma2)
+    log_growth += mu
+
+    # B_t = G_t * (B_0 + C * sum_{s<=t} 1 / G_s), with G_t the cumulative growth factor
+    growth = np.exp(np.cumsum(log_growth, axis=0, out=log_growth), out=log_growth)
+    np.cumsum(1 / growth, axis=0, out=balances[1:])
+    balances[1:] *= annual_contribution
+    balances[1:] += retirement_savings
+    balances[1:] *= growth
+
+    final_balances = balances[-1].copy()
+    bands = np.percentile(balances, percentiles, axis=1)
+
+    return SimulationResult(
+        years=np.arange(horizon + 1),
+        percentiles={p: band for p, band in zip(percentiles, bands)},
+        final_balances=final_balances,
+        success_probability=float(np.mean(final_balances >= target_balance)),
+    )
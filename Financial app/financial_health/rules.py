@@ -0,0 +1,267 @@
+"""Declarative thresholds for the health statuses and recommendations.
+
+``DEFAULT_RULES`` is plain data, so a region or client can override any part
+of it from a JSON file (see ``load_rules``). ``RuleSet`` compiles a rule
+table once into threshold and message arrays and evaluates it with
+``np.searchsorted``, so one interactive profile and a million-row batch get
+identical statuses and recommendation text.
+
+Each recommendation rule names a metric, sorted ``thresholds`` and one
+message (or None) per band: ``len(thresholds) + 1`` of them, from lowest to
+highest. With ``"side": "right"`` a value equal to a threshold belongs to the
+band above it (rules of the form ``value < threshold``); with ``"left"`` it
+stays in the band below (``value > threshold``). Messages may use
+``{value}``, the metric's value.
+"""
+
+import copy
+import itertools
+import json
+import string
+
+import numpy as np
+
+DEFAULT_RULES = {
+    # Colour-coded indicators: values map to the first category whose
+    # threshold they do not exceed; values above every threshold get the last.
+    # "labels" (one per category) and "unit" are for the dashboard legend
+    "statuses": {
+        "savings_status": {"metric": "savings_rate", "thresholds": [0, 10, 20], "categories": ["danger", "warning", "good"],
+                           "labels": ["Danger", "Caution", "Excellent"], "unit": "%"},
+        "dti_status": {"metric": "debt_to_income", "thresholds": [0, 28, 36], "categories": ["good", "warning", "danger"],
+                       "labels": ["Good", "Caution", "High Risk"], "unit": "%"},
+        "emergency_status": {"metric": "emergency_months", "thresholds": [0, 3, 6], "categories": ["danger", "warning", "good"],
+                             "labels": ["Danger", "Building", "Secure"], "unit": " months"},
+        "housing_status": {"metric": "housing_to_income", "thresholds": [0, 25, 33], "categories": ["good", "warning", "danger"],
+                           "labels": ["Affordable", "Moderate", "Cost Burdened"], "unit": "%"},
+    },
+    "health_recommendations": {
+        "rules": [
+            {"metric": "savings_rate", "thresholds": [10, 20], "side": "right", "messages": [
+                "Increase your savings rate to at least 10% by cutting non-essential expenses.",
+                "Consider boosting your savings rate to 20% to build wealth faster.",
+                None,
+            ]},
+            {"metric": "debt_to_income", "thresholds": [28, 36], "side": "left", "messages": [
+                None,
+                "Work on reducing your debt-to-income ratio to less than 28% for better financial health.",
+                "Your debt payments are too high relative to income. Focus on paying down high-interest debt.",
+            ]},
+            {"metric": "emergency_months", "thresholds": [3, 6], "side": "right", "messages": [
+                "Build your emergency fund to cover at least 3 months of expenses.",
+                "Continue building your emergency fund to reach a 6-month safety net.",
+                None,
+            ]},
+            {"metric": "housing_to_income", "thresholds": [33], "side": "left", "messages": [
+                None,
+                "Your housing costs are high relative to your income. Consider ways to reduce housing expenses.",
+            ]},
+            {"metric": "credit_card", "thresholds": [0], "side": "left", "messages": [
+                None,
+                "Prioritize paying off high-interest credit card debt as quickly as possible.",
+            ]},
+        ],
+        # Shown when no rule produced a message
+        "fallback": "Great job! Your financial health is strong. Consider increasing investments for long-term wealth.",
+    },
+    "budget_recommendations": {
+        "rules": [
+            {"metric": "needs", "thresholds": [50], "side": "left", "messages": [
+                None,
+                "Your essential expenses (needs) are {value:.1f}% of income, which is above the recommended 50%. Consider finding ways to reduce housing, transportation, or utility costs.",
+            ]},
+            {"metric": "wants", "thresholds": [30], "side": "left", "messages": [
+                None,
+                "Your discretionary spending (wants) is {value:.1f}% of income, above the recommended 30%. Try cutting back on entertainment and non-essential purchases.",
+            ]},
+            {"metric": "savings_debt", "thresholds": [20], "side": "right", "messages": [
+                "You're only allocating {value:.1f}% to savings and debt repayment, below the recommended 20%. Increase this allocation to build long-term wealth.",
+                None,
+            ]},
+        ],
+        # Always added last, naming the largest expense category
+        "highest_expense": "Your highest expense category is {category}. Look for ways to optimize this area of your budget.",
+    },
+}
+
+
+def get_health_status(values, thresholds, categories):
+    """Map values to the first category whose threshold they do not exceed.
+
+    Values above every threshold fall into the last category. Works on scalars
+    and arrays alike.
+    """
+    index = np.searchsorted(np.asarray(thresholds, dtype=float), np.asarray(values, dtype=float), side="left")
+    index = np.minimum(index, len(categories) - 1)
+    if np.ndim(index) == 0:
+        return categories[int(index)]
+    return np.asarray(categories, dtype=object)[index]
+
+
+def merge_rules(base, overrides):
+    """``base`` with ``overrides`` applied: nested dicts merge key by key, anything else replaces."""
+    merged = copy.deepcopy(base)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_rules(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_rules(path):
+    """A ``RuleSet`` from a JSON file of overrides to ``DEFAULT_RULES``."""
+    with open(path) as rules_file:
+        return RuleSet(json.load(rules_file))
+
+
+def _object_array(items):
+    array = np.empty(len(items), dtype=object)
+    array[:] = items
+    return array
+
+
+def _escape(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _positional(template, position):
+    """``template`` with its ``{value}`` fields renumbered to ``{position}``."""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts.append(_escape(literal))
+        if field is not None:
+            if field == "value" or field.startswith(("value.", "value[")):
+                field = str(position) + field[len("value"):]
+            parts.append("{" + field + ("!" + conversion if conversion else "") + (":" + spec if spec else "") + "}")
+    return "".join(parts)
+
+
+class _MessageRule:
+    def __init__(self, rule):
+        self.metric = rule["metric"]
+        self.thresholds = np.asarray(rule["thresholds"], dtype=float)
+        self.side = rule.get("side", "right")
+        self.messages = list(rule["messages"])
+        if len(self.messages) != len(self.thresholds) + 1:
+            raise ValueError(f"Rule for {self.metric!r} needs {len(self.thresholds) + 1} messages, got {len(self.messages)}")
+        if self.side not in ("left", "right"):
+            raise ValueError(f"Rule for {self.metric!r} has side {self.side!r}; expected 'left' or 'right'")
+        self.templated = [message is not None and "{" in message for message in self.messages]
+
+    def evaluate(self, metrics):
+        """(messages, templated, band per row, values) for ``RuleSet._recommend``."""
+        values = np.asarray(metrics[self.metric], dtype=float).reshape(-1)
+        return self.messages, self.templated, np.searchsorted(self.thresholds, values, side=self.side), values
+
+
+class RuleSet:
+    """A rule table (``DEFAULT_RULES`` with optional overrides), compiled for evaluation.
+
+    Every method takes metrics as a mapping of name -> scalar or 1-D array
+    and returns one result per row.
+    """
+
+    def __init__(self, overrides=None):
+        self.rules = merge_rules(DEFAULT_RULES, overrides)
+        self._statuses = {
+            name: (status["metric"], np.asarray(status["thresholds"], dtype=float), list(status["categories"]))
+            for name, status in self.rules["statuses"].items()
+        }
+        health = self.rules["health_recommendations"]
+        self._health_rules = [_MessageRule(rule) for rule in health["rules"]]
+        self._health_fallback = health.get("fallback")
+        budget = self.rules["budget_recommendations"]
+        self._budget_rules = [_MessageRule(rule) for rule in budget["rules"]]
+        self._highest_expense = budget.get("highest_expense")
+
+    def status_legend(self, name):
+        """``(range, category, label)`` per band of the ``statuses`` entry ``name``, for display.
+
+        The first threshold is the bottom of the scale, so the bands are split
+        at the others: "Less than" the second, ranges between, "Over" the last.
+        Categories without a label are shown capitalized.
+        """
+        status = self.rules["statuses"][name]
+        _, thresholds, categories = self._statuses[name]
+        labels = status.get("labels") or []
+        unit = status.get("unit", "")
+        bounds = [f"{threshold:g}" for threshold in thresholds[1:]]
+        ranges = ([f"Less than {bounds[0]}{unit}"] if bounds else []) + [
+            f"{low}-{high}{unit}" for low, high in zip(bounds, bounds[1:])
+        ] + ([f"Over {bounds[-1]}{unit}"] if bounds else ["Any value"])
+        return [(text, category, labels[index] if index < len(labels) else category.capitalize())
+                for index, (text, category) in enumerate(zip(ranges, categories))]
+
+    def statuses(self, metrics):
+        """Status category per row for every entry in ``statuses``, as object arrays."""
+        return {
+            name: get_health_status(np.asarray(metrics[metric], dtype=float), thresholds, categories)
+            for name, (metric, thresholds, categories) in self._statuses.items()
+        }
+
+    @staticmethod
+    def _recommend(columns, rows, fallback=None, separator=None):
+        """Each row's messages in column order: a list per row, or with a
+        ``separator`` one joined string per row (object array).
+
+        Rows that fall in the same band of every column get the same text, so
+        each distinct combination is assembled once; only templated messages
+        are formatted per row, with one ``format`` call per row.
+        """
+        key = np.zeros(rows, dtype=np.int64)
+        for messages, _, bands, _ in columns:
+            key = key * len(messages) + bands
+        _, first_rows, combos = np.unique(key, return_index=True, return_inverse=True)
+        members_by_combo = np.split(np.argsort(combos, kind="stable"), np.cumsum(np.bincount(combos.reshape(-1)))[:-1])
+
+        result = [None] * rows if separator is None else np.empty(rows, dtype=object)
+        for first_row, members in zip(first_rows, members_by_combo):
+            chosen = [(messages[bands[first_row]], templated[bands[first_row]], values)
+                      for messages, templated, bands, values in columns if messages[bands[first_row]] is not None]
+            if not chosen and fallback is not None:
+                chosen = [(fallback, False, None)]
+            fields = [values[members].tolist() for _, is_template, values in chosen if is_template]
+
+            if separator is None:
+                for row, args in zip(members.tolist(), zip(*fields) if fields else itertools.repeat(())):
+                    args = iter(args)
+                    result[row] = [message.format(value=next(args)) if is_template else message
+                                   for message, is_template, _ in chosen]
+            elif not fields:
+                result[members] = separator.join(message for message, _, _ in chosen)
+            else:
+                # One positional template for the whole joined text
+                parts, position = [], 0
+                for message, is_template, _ in chosen:
+                    if is_template:
+                        parts.append(_positional(message, position))
+                        position += 1
+                    else:
+                        parts.append(_escape(message))
+                template = _escape(separator).join(parts)
+                result[members] = _object_array([template.format(*args) for args in zip(*fields)])
+        return result
+
+    def health_recommendations(self, metrics, separator=None):
+        """Recommendations per row from ``savings_rate``, ``debt_to_income``,
+        ``emergency_months``, ``housing_to_income`` and ``credit_card`` (or the
+        metrics the rules name): a list per row, or joined with ``separator``."""
+        columns = [rule.evaluate(metrics) for rule in self._health_rules]
+        rows = len(columns[0][2]) if columns else max(np.size(value) for value in metrics.values())
+        return self._recommend(columns, rows, self._health_fallback, separator)
+
+    def budget_recommendations(self, metrics, expense_values, expense_labels, separator=None):
+        """Budget suggestions per row from ``needs``, ``wants`` and
+        ``savings_debt``; ``expense_values`` is a (rows, categories) array
+        following ``expense_labels``. A list per row, or joined with ``separator``."""
+        columns = [rule.evaluate(metrics) for rule in self._budget_rules]
+        expense_values = np.atleast_2d(np.asarray(expense_values, dtype=float))
+        if self._highest_expense:
+            # argmax picks the first of tied categories, like list.index(max(...))
+            messages = [self._highest_expense.format(category=label) for label in expense_labels]
+            columns.append((messages, [False] * len(messages), np.argmax(expense_values, axis=1), None))
+        return self._recommend(columns, len(expense_values), separator=separator)
+
+
+DEFAULT_RULE_SET = RuleSet()
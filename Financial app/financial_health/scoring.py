@@ -0,0 +1,121 @@
+"""Vectorized financial health scoring engine.
+
+Every metric shown on the dashboard is computed here from a columnar table of
+the sidebar inputs, so a single interactive profile and a nightly batch of
+hundreds of thousands of households go through exactly the same arithmetic.
+The core only needs NumPy; pandas is imported when a DataFrame is requested.
+"""
+
+import numpy as np
+
+from .rules import DEFAULT_RULE_SET
+
+# Sidebar inputs, grouped the same way as in the app
+INCOME_COLUMNS = ["monthly_salary", "side_income", "other_income"]
+EXPENSE_COLUMNS = ["housing", "utilities", "groceries", "transportation", "healthcare", "entertainment", "other_expenses"]
+DEBT_COLUMNS = ["student_loan", "car_loan", "credit_card", "mortgage", "other_debt"]
+DEBT_PAYMENT_COLUMNS = ["student_loan_payment", "car_loan_payment", "credit_card_payment", "mortgage_payment", "other_debt_payment"]
+ASSET_COLUMNS = ["emergency_fund", "investments", "retirement", "property_value", "other_assets"]
+
+INPUT_COLUMNS = INCOME_COLUMNS + EXPENSE_COLUMNS + DEBT_COLUMNS + DEBT_PAYMENT_COLUMNS + ASSET_COLUMNS
+
+# Expenses counted as "needs" in the 50/30/20 analysis
+NEEDS_COLUMNS = ["housing", "utilities", "groceries", "transportation", "healthcare"]
+
+
+def _ratio(numerator, denominator):
+    """numerator / denominator, or 0 where the denominator is not positive."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    positive = denominator > 0
+    np.divide(numerator, denominator, out=out, where=positive)
+    return out
+
+
+def score_arrays(data, rules=DEFAULT_RULE_SET):
+    """Score profiles given as a mapping of input column -> NumPy array.
+
+    Returns a dict of equal-length arrays with totals, ratios, status classes
+    (from the ``rules`` status thresholds), sub-scores and the 0-100
+    ``financial_health_score``.
+    """
+    total_monthly_income = sum(data[col] for col in INCOME_COLUMNS)
+    total_monthly_expenses = sum(data[col] for col in EXPENSE_COLUMNS)
+    total_debt = sum(data[col] for col in DEBT_COLUMNS)
+    total_debt_payment = sum(data[col] for col in DEBT_PAYMENT_COLUMNS)
+    total_assets = sum(data[col] for col in ASSET_COLUMNS)
+
+    monthly_savings = total_monthly_income - total_monthly_expenses - total_debt_payment
+    net_worth = total_assets - total_debt
+
+    # Key financial health metrics
+    savings_rate = _ratio(monthly_savings, total_monthly_income) * 100
+    debt_to_income = _ratio(total_debt_payment, total_monthly_income) * 100
+    housing_to_income = _ratio(data["housing"], total_monthly_income) * 100
+    emergency_months = _ratio(data["emergency_fund"], total_monthly_expenses)
+    debt_to_asset = _ratio(total_debt, total_assets) * 100
+
+    # 50/30/20 budget shares
+    needs = _ratio(sum(data[col] for col in NEEDS_COLUMNS), total_monthly_income) * 100
+    wants = _ratio(data["entertainment"], total_monthly_income) * 100
+    savings_debt = _ratio(monthly_savings + total_debt_payment, total_monthly_income) * 100
+
+    # Overall financial health score (0-100)
+    savings_score = np.minimum(savings_rate / 30 * 25, 25)  # 25% weight
+    debt_score = np.minimum(np.maximum(0, (50 - debt_to_income) / 50 * 25), 25)  # 25% weight
+    emergency_score = np.minimum(emergency_months / 12 * 25, 25)  # 25% weight
+    housing_score = np.minimum(np.maximum(0, (40 - housing_to_income) / 40 * 15), 15)  # 15% weight
+    net_worth_score = np.minimum(np.maximum(0, _ratio(net_worth, total_monthly_income * 12 * 10) * 10), 10)  # 10% weight
+
+    financial_health_score = savings_score + debt_score + emergency_score + housing_score + net_worth_score
+
+    result = {
+        "total_monthly_income": total_monthly_income,
+        "total_monthly_expenses": total_monthly_expenses,
+        "total_debt": total_debt,
+        "total_debt_payment": total_debt_payment,
+        "total_assets": total_assets,
+        "monthly_savings": monthly_savings,
+        "net_worth": net_worth,
+        "savings_rate": savings_rate,
+        "debt_to_income": debt_to_income,
+        "housing_to_income": housing_to_income,
+        "emergency_months": emergency_months,
+        "debt_to_asset": debt_to_asset,
+        "needs": needs,
+        "wants": wants,
+        "savings_debt": savings_debt,
+    }
+    result.update(rules.statuses(result))
+    result.update({
+        "savings_score": savings_score,
+        "debt_score": debt_score,
+        "emergency_score": emergency_score,
+        "housing_score": housing_score,
+        "net_worth_score": net_worth_score,
+        "financial_health_score": financial_health_score,
+    })
+    return result
+
+
+def score_households(df, rules=DEFAULT_RULE_SET):
+    """Score a table of household profiles in one vectorized pass.
+
+    ``df`` holds the ``INPUT_COLUMNS``; any it lacks are treated as zero.
+    Returns a DataFrame (same index) with the columns produced by
+    ``score_arrays``.
+    """
+    import pandas as pd
+
+    data = {col: df[col].to_numpy(dtype=float) if col in df else np.zeros(len(df)) for col in INPUT_COLUMNS}
+    return pd.DataFrame(score_arrays(data, rules), index=df.index)
+
+
+def score_profile(profile, rules=DEFAULT_RULE_SET):
+    """Score a single profile given as a mapping of input column -> value.
+
+    Returns plain Python floats and strings.
+    """
+    data = {col: np.array([profile.get(col, 0)], dtype=float) for col in INPUT_COLUMNS}
+    return {key: values.tolist()[0] for key, values in score_arrays(data, rules).items()}
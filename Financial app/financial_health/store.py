@@ -0,0 +1,182 @@
+"""Local SQLite store of profile snapshots, for tracking progress over time.
+
+Each snapshot keeps the sidebar inputs together with the net worth and
+financial health score computed from them, keyed by user and date (one per
+user per day; saving again the same day replaces it). The table is clustered
+on ``(user_id, snapshot_date)``, so a user's history is one contiguous index
+range and years of snapshots are read in milliseconds.
+
+Writes from all sessions go through one background thread that commits them
+in batched transactions, so concurrent sessions never wait on each other for
+the database lock; each save returns a future that reports its own write.
+Reads use a connection per thread and, with SQLite's WAL journal, run
+alongside the writer.
+"""
+
+import datetime
+import json
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+
+import numpy as np
+
+from .profile import Profile
+
+DEFAULT_PATH = "financial_health.db"
+WRITE_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    user_id TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    net_worth REAL NOT NULL,
+    financial_health_score REAL NOT NULL,
+    PRIMARY KEY (user_id, snapshot_date)
+) WITHOUT ROWID
+"""
+
+_INSERT = "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?)"
+
+
+def _snapshot_row(user_id, profile, net_worth, financial_health_score, snapshot_date=None):
+    snapshot_date = snapshot_date or datetime.date.today()
+    if isinstance(profile, Profile):
+        profile = profile.to_dict()
+    return (str(user_id), str(snapshot_date), json.dumps(profile, sort_keys=True),
+            float(net_worth), float(financial_health_score))
+
+
+class ProfileStore:
+    """Profile snapshots in the SQLite database at ``path``, shared across threads."""
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=WRITE_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._queue = queue.Queue()
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(SCHEMA)
+        connection.commit()
+
+        self._writer = threading.Thread(target=self._write_loop, name="profile-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _write_loop(self):
+        connection = self._connection()
+        while True:
+            items = [self._queue.get()]
+            # Take whatever else is waiting so it lands in the same transaction
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in items
+            items = [item for item in items if item is not None]
+            try:
+                with connection:
+                    connection.executemany(_INSERT, [row for row, _ in items])
+            except sqlite3.Error as exc:
+                # The batch is rolled back, so every save in it failed
+                for _, future in items:
+                    future.set_exception(exc)
+            else:
+                for _, future in items:
+                    future.set_result(None)
+            finally:
+                for _ in range(len(items) + stop):
+                    self._queue.task_done()
+            if stop:
+                connection.close()
+                return
+
+    def save_snapshot(self, user_id, profile, metrics, snapshot_date=None):
+        """Queue a snapshot of ``profile`` (a ``Profile`` or dict of the sidebar inputs) and its ``metrics``.
+
+        ``metrics`` is the ``score_profile`` result; only the net worth and
+        the financial health score are kept from it. ``snapshot_date``
+        defaults to today. The write happens in the background: the returned
+        ``concurrent.futures.Future`` completes when this snapshot is
+        committed, and ``result()`` waits for it and raises its write error.
+        """
+        future = Future()
+        self._queue.put((_snapshot_row(user_id, profile, metrics["net_worth"], metrics["financial_health_score"], snapshot_date),
+                         future))
+        return future
+
+    def save_snapshots(self, rows):
+        """Write many snapshots in one transaction, e.g. to backfill history.
+
+        ``rows`` yields ``(user_id, snapshot_date, profile, net_worth,
+        financial_health_score)`` tuples.
+        """
+        connection = self._connection()
+        with connection:
+            connection.executemany(_INSERT, (
+                _snapshot_row(user_id, profile, net_worth, score, snapshot_date)
+                for user_id, snapshot_date, profile, net_worth, score in rows
+            ))
+
+    def flush(self):
+        """Wait until every snapshot queued so far, from any session, has been written.
+
+        Errors are reported through each ``save_snapshot`` future, not here.
+        """
+        self._queue.join()
+
+    def close(self):
+        """Write the remaining snapshots and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def latest_profile(self, user_id):
+        """The inputs from the user's most recent snapshot, or None if there is none."""
+        row = self._connection().execute(
+            "SELECT profile FROM snapshots WHERE user_id = ? ORDER BY snapshot_date DESC LIMIT 1", (str(user_id),)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def progress(self, user_id, start=None, end=None, monthly=True):
+        """Net worth and score history for one user, oldest first.
+
+        With ``monthly`` only the last snapshot of each calendar month is
+        returned. ``start`` and ``end`` optionally bound the dates
+        (inclusive). Returns a dict of NumPy arrays: ``dates``
+        (``datetime64[D]``), ``net_worth`` and ``financial_health_score``.
+        """
+        params = [str(user_id), str(start or "0000-00-00"), str(end or "9999-99-99")]
+        if monthly:
+            # SQLite fills bare columns from the row holding max(snapshot_date)
+            query = ("SELECT max(snapshot_date), net_worth, financial_health_score FROM snapshots "
+                     "WHERE user_id = ? AND snapshot_date BETWEEN ? AND ? "
+                     "GROUP BY substr(snapshot_date, 1, 7) ORDER BY 1")
+        else:
+            query = ("SELECT snapshot_date, net_worth, financial_health_score FROM snapshots "
+                     "WHERE user_id = ? AND snapshot_date BETWEEN ? AND ? ORDER BY snapshot_date")
+        rows = self._connection().execute(query, params).fetchall()
+
+        dates, net_worth, scores = zip(*rows) if rows else ((), (), ())
+        return {
+            "dates": np.array(dates, dtype="datetime64[D]"),
+            "net_worth": np.array(net_worth, dtype=float),
+            "financial_health_score": np.array(scores, dtype=float),
+        }
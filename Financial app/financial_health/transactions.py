@@ -0,0 +1,155 @@
+"""Bulk import of bank transactions into the dashboard's expense categories.
+
+Exports are read in fixed-size chunks (CSV via pandas, Parquet via pyarrow
+record batches); each chunk is categorized with vectorized keyword matching
+and reduced to per-month category totals before the next one is read, so
+memory is bounded by the chunk size rather than the file size.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+# Keyword rules per expense category, checked in order; the first match wins.
+# "Debt Payments" is recognised so loan payments don't land in Other Expenses,
+# but it is reported separately from the seven sidebar expense fields.
+CATEGORY_KEYWORDS = {
+    "Housing": ["rent", "mortgage", "landlord", "hoa", "property management"],
+    "Utilities": ["electric", "power", "water", "gas bill", "utility", "internet", "comcast", "verizon", "at&t", "phone"],
+    "Groceries": ["grocery", "supermarket", "whole foods", "trader joe", "kroger", "safeway", "aldi", "costco", "walmart"],
+    "Transportation": ["uber", "lyft", "fuel", "shell", "chevron", "exxon", "parking", "transit", "metro", "toll", "car wash"],
+    "Healthcare": ["pharmacy", "cvs", "walgreens", "doctor", "dental", "clinic", "hospital", "medical", "health"],
+    "Entertainment": ["netflix", "spotify", "hulu", "cinema", "movie", "theater", "concert", "steam", "restaurant"],
+    "Debt Payments": ["loan payment", "credit card payment", "student loan", "auto loan", "navient", "sallie mae"],
+}
+OTHER_CATEGORY = "Other Expenses"
+EXPENSE_CATEGORIES = [category for category in CATEGORY_KEYWORDS if category != "Debt Payments"] + [OTHER_CATEGORY]
+
+DEFAULT_CHUNKSIZE = 100_000
+# Share of non-blank dates that may fail to parse (e.g. summary rows) before
+# the import is rejected as read with the wrong date format
+MAX_UNPARSED_DATE_SHARE = 0.05
+
+# Whole words only (plurals allowed), so "rent" doesn't match "current"
+_CATEGORY_PATTERNS = {
+    category: re.compile(r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")s?\b")
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+
+def categorize(descriptions):
+    """Assign an expense category to every description (a pandas Series).
+
+    Bank exports repeat the same merchant strings many times, so the keyword
+    rules run once per distinct description and are mapped back by code.
+    Keywords match whole words:
+
+    >>> categorize(pd.Series(["Monthly rent", "Transfer to current account", "Water bill"])).tolist()
+    ['Housing', 'Other Expenses', 'Utilities']
+    """
+    codes, uniques = pd.factorize(descriptions.fillna("").astype(str))
+    text = pd.Series(uniques).str.lower()
+    categories = np.full(len(text), OTHER_CATEGORY, dtype=object)
+    unassigned = np.ones(len(text), dtype=bool)
+    for category, pattern in _CATEGORY_PATTERNS.items():
+        matched = unassigned & text.str.contains(pattern, regex=True).to_numpy()
+        categories[matched] = category
+        unassigned &= ~matched
+    return pd.Series(categories[codes], index=descriptions.index)
+
+
+def _guess_date_format(dates):
+    """strftime format of the first date string in a Series, or None if it can't be guessed."""
+    dates = dates.dropna()
+    if dates.empty or not isinstance(dates.iloc[0], str):
+        return None
+    return guess_datetime_format(dates.iloc[0])
+
+
+def _month_numbers(dates, date_format=None):
+    """Month number (year * 12 + month) for a Series of dates, -1 where unparseable.
+
+    Each distinct date string is parsed once and mapped back by code.
+    """
+    codes, uniques = pd.factorize(dates)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format=date_format, errors="coerce")
+    numbers = (parsed.dt.year * 12 + parsed.dt.month - 1).fillna(-1).to_numpy(dtype=np.int64)
+    return np.where(codes >= 0, numbers[codes], -1)
+
+
+def iter_chunks(source, file_format=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield DataFrame chunks of at most ``chunksize`` rows from a CSV or Parquet source.
+
+    ``source`` is a path or a binary file object. The format is taken from
+    ``file_format`` or, failing that, the path's extension.
+    """
+    if file_format is None:
+        name = source if isinstance(source, str) else getattr(source, "name", "")
+        file_format = "parquet" if str(name).lower().endswith(".parquet") else "csv"
+
+    if file_format == "csv":
+        yield from pd.read_csv(source, chunksize=chunksize)
+    elif file_format == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Reading Parquet transaction files requires pyarrow (pip install pyarrow)") from exc
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported transaction file format: {file_format!r}")
+
+
+def aggregate_transactions(source, file_format=None, chunksize=DEFAULT_CHUNKSIZE, date_column="date",
+                           amount_column="amount", description_column="description", debits_are_negative=True,
+                           date_format=None):
+    """Stream a transaction export and return average monthly spend per category.
+
+    Expenses are the debit rows (negative amounts by default, positive if
+    ``debits_are_negative`` is False); credits such as salary are ignored.
+    The average is taken over every month that appears in the file. Returns a
+    Series indexed by category, including "Debt Payments".
+
+    Dates are parsed with ``date_format`` (a strftime format such as
+    ``"%d/%m/%Y"``) or, if it is None, with the format guessed from the first
+    date in the file, so every chunk is read the same way. Raises ValueError
+    if more than ``MAX_UNPARSED_DATE_SHARE`` of the non-blank dates don't parse.
+    """
+    totals = None
+    months = set()
+    dated_rows = unparsed_rows = 0
+
+    for chunk in iter_chunks(source, file_format, chunksize):
+        chunk.columns = [str(column).strip().lower() for column in chunk.columns]
+        missing = {date_column, amount_column, description_column} - set(chunk.columns)
+        if missing:
+            raise ValueError(f"Transaction file is missing column(s): {', '.join(sorted(missing))}")
+
+        amounts = pd.to_numeric(chunk[amount_column], errors="coerce")
+        if date_format is None:
+            date_format = _guess_date_format(chunk[date_column])
+        month = _month_numbers(chunk[date_column], date_format)
+        dated = chunk[date_column].notna().to_numpy()
+        dated_rows += int(dated.sum())
+        unparsed_rows += int((dated & (month < 0)).sum())
+        months.update(np.unique(month[month >= 0]).tolist())
+
+        debits = (amounts < 0) if debits_are_negative else (amounts > 0)
+        debits &= month >= 0
+        if not debits.any():
+            continue
+
+        spend = amounts[debits].abs()
+        chunk_totals = spend.groupby(categorize(chunk.loc[debits, description_column])).sum()
+        totals = chunk_totals if totals is None else totals.add(chunk_totals, fill_value=0)
+
+    if unparsed_rows > MAX_UNPARSED_DATE_SHARE * dated_rows:
+        raise ValueError(f"{unparsed_rows:,} of {dated_rows:,} dates in column {date_column!r} could not be read"
+                         + (f" as {date_format!r}" if date_format else "") + "; choose the file's date format")
+
+    categories = EXPENSE_CATEGORIES + ["Debt Payments"]
+    if totals is None or not months:
+        return pd.Series(0.0, index=categories)
+    return (totals.reindex(categories, fill_value=0) / len(months)).astype(float)
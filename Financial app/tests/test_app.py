@@ -0,0 +1,72 @@
+"""End-to-end checks of the dashboard script with Streamlit's ``AppTest``.
+
+Run from the ``Financial app`` directory:
+
+    python -m pytest tests
+"""
+
+import datetime
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from financial_health import score_profile
+from financial_health.store import ProfileStore
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def run_app(profile_name=None):
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    app.run()
+    if profile_name is not None:
+        app.sidebar.text_input[0].input(profile_name).run()
+    assert not app.exception
+    return app
+
+
+def number_input(app, label):
+    return next(widget for widget in app.sidebar.number_input if widget.label == label)
+
+
+@pytest.fixture
+def snapshot_db(tmp_path, monkeypatch):
+    path = str(tmp_path / "snapshots.db")
+    monkeypatch.setenv("FINANCIAL_HEALTH_DB", path)
+    return path
+
+
+def test_snapshots_off_by_default(monkeypatch):
+    monkeypatch.delenv("FINANCIAL_HEALTH_DB", raising=False)
+    app = run_app()
+    assert not app.sidebar.text_input
+    assert not [button for button in app.sidebar.button if button.label == "Save Snapshot"]
+
+
+def test_save_and_restore_snapshot(snapshot_db):
+    app = run_app("alice")
+    number_input(app, "Monthly Salary (After Tax)").set_value(5200)
+    number_input(app, "Housing (Rent/Mortgage)").set_value(1450)
+    app.run()
+    next(button for button in app.sidebar.button if button.label == "Save Snapshot").click().run()
+    assert not app.exception
+    assert "alice" in app.sidebar.success[0].value
+
+    # A new session restores the saved inputs from the name alone
+    restored = run_app("alice")
+    assert number_input(restored, "Monthly Salary (After Tax)").value == 5200
+    assert number_input(restored, "Housing (Rent/Mortgage)").value == 1450
+
+
+def test_restore_float_snapshot_values(snapshot_db):
+    # Snapshots written in bulk (or by other tools) can hold floats for the integer inputs
+    profile = {"monthly_salary": 4321.0, "housing": 999.6, "retirement": 12345.0}
+    store = ProfileStore(snapshot_db)
+    store.save_snapshots([("bob", datetime.date(2024, 1, 1), profile, 0.0, score_profile(profile)["financial_health_score"])])
+    store.close()
+
+    app = run_app("bob")
+    assert number_input(app, "Monthly Salary (After Tax)").value == 4321
+    assert number_input(app, "Housing (Rent/Mortgage)").value == 1000
+    assert number_input(app, "Retirement Accounts").value == 12345